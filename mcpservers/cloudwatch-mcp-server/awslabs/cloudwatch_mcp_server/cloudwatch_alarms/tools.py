@@ -14,10 +14,8 @@
 
 """CloudWatch Alarms tools for MCP server."""
 
-import boto3
-import json
-import os
-from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
+import asyncio
+import re
 from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.models import (
     ActiveAlarmsResponse,
     AlarmDetails,
@@ -28,36 +26,41 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.models import (
     MetricAlarmSummary,
     TimeRangeSuggestion,
 )
-from botocore.config import Config
+from awslabs.cloudwatch_mcp_server.common import BotoClientCache, parse_iso8601
 from datetime import datetime, timedelta
 from loguru import logger
 from mcp.server.fastmcp import Context
 from pydantic import Field
+from pydantic_core import from_json
 from typing import Annotated, Any, Dict, List, Union
 
 
+# DescribeAlarms accepts at most 100 alarm names per request
+DESCRIBE_ALARMS_MAX_NAMES = 100
+
+# Window of alarm history returned when no start_time is given
+DEFAULT_ALARM_HISTORY_WINDOW = timedelta(days=1)
+
+
 class CloudWatchAlarmsTools:
     """CloudWatch Alarms tools for MCP server."""
 
     def __init__(self):
         """Initialize the CloudWatch Alarms tools."""
-        pass
+        self._clients = BotoClientCache('cloudwatch')
 
     def _get_cloudwatch_client(self, region: str):
-        """Create a CloudWatch client for the specified region."""
-        config = Config(user_agent_extra=f'awslabs/mcp/cloudwatch-mcp-server/{MCP_SERVER_VERSION}')
-
+        """Get a cached CloudWatch client for the specified region."""
         try:
-            if aws_profile := os.environ.get('AWS_PROFILE'):
-                return boto3.Session(profile_name=aws_profile, region_name=region).client(
-                    'cloudwatch', config=config
-                )
-            else:
-                return boto3.Session(region_name=region).client('cloudwatch', config=config)
+            return self._clients.get(region)
         except Exception as e:
             logger.error(f'Error creating cloudwatch client for region {region}: {str(e)}')
             raise
 
+    def close(self):
+        """Close all cached clients and release their HTTP connection pools."""
+        self._clients.close()
+
     def register(self, mcp):
         """Register all CloudWatch Alarms tools with the MCP server."""
         # Register get_active_alarms tool
@@ -139,7 +142,10 @@ class CloudWatchAlarmsTools:
             total_items_fetched = 0
             items_to_return = 0
 
-            for page in page_iterator:
+            # boto3 is synchronous, so fetch the pages off the event loop
+            pages = await asyncio.to_thread(list, page_iterator)
+
+            for page in pages:
                 metric_alarms_list = page.get('MetricAlarms', [])
                 composite_alarms_list = page.get('CompositeAlarms', [])
 
@@ -277,12 +283,12 @@ class CloudWatchAlarmsTools:
             if end_time is None or not isinstance(end_time, str):
                 end_time_dt = datetime.now()
             else:
-                end_time_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+                end_time_dt = parse_iso8601(end_time)
 
             if start_time is None or not isinstance(start_time, str):
-                start_time_dt = end_time_dt - timedelta(days=1)
+                start_time_dt = end_time_dt - DEFAULT_ALARM_HISTORY_WINDOW
             else:
-                start_time_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+                start_time_dt = parse_iso8601(start_time)
 
             logger.info(f'Fetching alarm history for {alarm_name}')
             logger.info(f'Time range: {start_time_dt} to {end_time_dt}')
@@ -301,7 +307,9 @@ class CloudWatchAlarmsTools:
             total_items_fetched = 0
             items_to_return = 0
 
-            for page in page_iterator:
+            pages = await asyncio.to_thread(list, page_iterator)
+
+            for page in pages:
                 items_list = page.get('AlarmHistoryItems', [])
                 total_items_fetched += len(items_list)
 
@@ -355,9 +363,10 @@ class CloudWatchAlarmsTools:
     def _transform_metric_alarm(self, alarm: Dict[str, Any]) -> MetricAlarmSummary:
         """Transform AWS SDK metric alarm to summary model."""
         # Extract key dimensions only
-        dimensions = []
-        for dim in alarm.get('Dimensions', []):
-            dimensions.append({'Name': dim.get('Name', ''), 'Value': dim.get('Value', '')})
+        dimensions = [
+            {'Name': dim.get('Name', ''), 'Value': dim.get('Value', '')}
+            for dim in alarm.get('Dimensions', [])
+        ]
 
         return MetricAlarmSummary(
             alarm_name=alarm.get('AlarmName', ''),
@@ -369,7 +378,7 @@ class CloudWatchAlarmsTools:
             dimensions=dimensions,
             threshold=float(alarm.get('Threshold', 0)),
             comparison_operator=alarm.get('ComparisonOperator', ''),
-            state_updated_timestamp=alarm.get('StateUpdatedTimestamp', datetime.now()),
+            state_updated_timestamp=alarm.get('StateUpdatedTimestamp') or datetime.now(),
         )
 
     def _transform_composite_alarm(self, alarm: Dict[str, Any]) -> CompositeAlarmSummary:
@@ -380,7 +389,7 @@ class CloudWatchAlarmsTools:
             state_value=alarm.get('StateValue', ''),
             state_reason=alarm.get('StateReason', ''),
             alarm_rule=alarm.get('AlarmRule', ''),
-            state_updated_timestamp=alarm.get('StateUpdatedTimestamp', datetime.now()),
+            state_updated_timestamp=alarm.get('StateUpdatedTimestamp') or datetime.now(),
         )
 
     async def _get_alarm_details(self, cloudwatch_client, alarm_name: str) -> AlarmDetails:
@@ -389,8 +398,10 @@ class CloudWatchAlarmsTools:
             logger.info(f'Fetching alarm details for {alarm_name}')
 
             # Call DescribeAlarms API for the specific alarm
-            response = cloudwatch_client.describe_alarms(
-                AlarmNames=[alarm_name], AlarmTypes=['MetricAlarm', 'CompositeAlarm']
+            response = await asyncio.to_thread(
+                cloudwatch_client.describe_alarms,
+                AlarmNames=[alarm_name],
+                AlarmTypes=['MetricAlarm', 'CompositeAlarm'],
             )
 
             # Check if alarm exists
@@ -408,39 +419,11 @@ class CloudWatchAlarmsTools:
 
             # Process metric alarm
             if metric_alarms:
-                alarm = metric_alarms[0]
-
-                # Extract dimensions
-                dimensions = []
-                for dim in alarm.get('Dimensions', []):
-                    dimensions.append({dim.get('Name', ''): dim.get('Value', '')})
-
-                return AlarmDetails(
-                    alarm_name=alarm.get('AlarmName', ''),
-                    alarm_description=alarm.get('AlarmDescription'),
-                    alarm_type='MetricAlarm',
-                    current_state=alarm.get('StateValue', ''),
-                    metric_name=alarm.get('MetricName', ''),
-                    namespace=alarm.get('Namespace', ''),
-                    dimensions=dimensions,
-                    threshold=alarm.get('Threshold'),
-                    comparison_operator=alarm.get('ComparisonOperator', ''),
-                    evaluation_periods=alarm.get('EvaluationPeriods', 1),
-                    period=alarm.get('Period', 300),
-                    statistic=alarm.get('Statistic', ''),
-                )
+                return self._metric_alarm_details(metric_alarms[0])
 
             # Process composite alarm
             elif composite_alarms:
-                alarm = composite_alarms[0]
-
-                return AlarmDetails(
-                    alarm_name=alarm.get('AlarmName', ''),
-                    alarm_description=alarm.get('AlarmDescription'),
-                    alarm_type='CompositeAlarm',
-                    current_state=alarm.get('StateValue', ''),
-                    alarm_rule=alarm.get('AlarmRule', ''),
-                )
+                return self._composite_alarm_details(composite_alarms[0])
 
             # This should never be reached, but ensure we always return something
             return AlarmDetails(
@@ -460,13 +443,105 @@ class CloudWatchAlarmsTools:
                 alarm_description=f'Error retrieving alarm details: {str(e)}',
             )
 
+    async def _get_component_alarm_details(
+        self, cloudwatch_client, alarm_names: List[str]
+    ) -> List[AlarmDetails]:
+        """Retrieve details for several alarms using batched DescribeAlarms calls.
+
+        Details are returned in the same order as alarm_names. Alarms that are not found, or
+        whose batch request failed, get placeholder details instead.
+        """
+        batches = [
+            alarm_names[i : i + DESCRIBE_ALARMS_MAX_NAMES]
+            for i in range(0, len(alarm_names), DESCRIBE_ALARMS_MAX_NAMES)
+        ]
+        responses = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    cloudwatch_client.describe_alarms,
+                    AlarmNames=batch,
+                    AlarmTypes=['MetricAlarm', 'CompositeAlarm'],
+                    MaxRecords=DESCRIBE_ALARMS_MAX_NAMES,
+                )
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
+
+        details_by_name: Dict[str, AlarmDetails] = {}
+        for batch, response in zip(batches, responses):
+            if isinstance(response, BaseException):
+                logger.warning(
+                    f'Failed to get details for component alarms {batch}: {str(response)}'
+                )
+                for alarm_name in batch:
+                    details_by_name[alarm_name] = AlarmDetails(
+                        alarm_name=alarm_name,
+                        alarm_type='Unknown',
+                        current_state='Unknown',
+                        alarm_description=f'Failed to retrieve details: {str(response)}',
+                    )
+                continue
+
+            for alarm in response.get('MetricAlarms', []):
+                details_by_name[alarm.get('AlarmName', '')] = self._metric_alarm_details(alarm)
+            for alarm in response.get('CompositeAlarms', []):
+                details_by_name[alarm.get('AlarmName', '')] = self._composite_alarm_details(alarm)
+
+        component_details = []
+        for alarm_name in alarm_names:
+            details = details_by_name.get(alarm_name)
+            if details is None:
+                logger.warning(f'Alarm {alarm_name} not found')
+                details = AlarmDetails(
+                    alarm_name=alarm_name,
+                    alarm_type='Unknown',
+                    current_state='Unknown',
+                    alarm_description='Alarm not found',
+                )
+            component_details.append(details)
+
+        return component_details
+
+    def _metric_alarm_details(self, alarm: Dict[str, Any]) -> AlarmDetails:
+        """Build alarm details from a DescribeAlarms metric alarm entry."""
+        # Extract dimensions
+        dimensions = [
+            {dim.get('Name', ''): dim.get('Value', '')} for dim in alarm.get('Dimensions', [])
+        ]
+
+        return AlarmDetails(
+            alarm_name=alarm.get('AlarmName', ''),
+            alarm_description=alarm.get('AlarmDescription'),
+            alarm_type='MetricAlarm',
+            current_state=alarm.get('StateValue', ''),
+            metric_name=alarm.get('MetricName', ''),
+            namespace=alarm.get('Namespace', ''),
+            dimensions=dimensions,
+            threshold=alarm.get('Threshold'),
+            comparison_operator=alarm.get('ComparisonOperator', ''),
+            evaluation_periods=alarm.get('EvaluationPeriods', 1),
+            period=alarm.get('Period', 300),
+            statistic=alarm.get('Statistic', ''),
+        )
+
+    def _composite_alarm_details(self, alarm: Dict[str, Any]) -> AlarmDetails:
+        """Build alarm details from a DescribeAlarms composite alarm entry."""
+        return AlarmDetails(
+            alarm_name=alarm.get('AlarmName', ''),
+            alarm_description=alarm.get('AlarmDescription'),
+            alarm_type='CompositeAlarm',
+            current_state=alarm.get('StateValue', ''),
+            alarm_rule=alarm.get('AlarmRule', ''),
+        )
+
     def _transform_history_item(self, item: Dict[str, Any]) -> AlarmHistoryItem:
         """Parse and transform a CloudWatch alarm history item."""
         try:
             # Extract basic information
             alarm_name = item.get('AlarmName', '')
             alarm_type = item.get('AlarmType', '')
-            timestamp = item.get('Timestamp', datetime.now())
+            timestamp = item.get('Timestamp') or datetime.now()
             history_item_type = item.get('HistoryItemType', '')
             history_summary = item.get('HistorySummary', '')
             history_data = item.get('HistoryData', '')
@@ -479,7 +554,7 @@ class CloudWatchAlarmsTools:
             # Parse HistoryData JSON for StateUpdate items
             if history_item_type == 'StateUpdate' and history_data:
                 try:
-                    data = json.loads(history_data)
+                    data = from_json(history_data)
 
                     # Extract old state information
                     if 'oldState' in data:
@@ -492,7 +567,7 @@ class CloudWatchAlarmsTools:
                         new_state = new_state_info.get('stateValue')
                         state_reason = new_state_info.get('stateReason')
 
-                except json.JSONDecodeError as e:
+                except ValueError as e:
                     logger.warning(f'Failed to parse HistoryData JSON for {alarm_name}: {str(e)}')
                     # Continue with basic information even if JSON parsing fails
                 except Exception as e:
@@ -515,7 +590,7 @@ class CloudWatchAlarmsTools:
             return AlarmHistoryItem(
                 alarm_name=item.get('AlarmName', ''),
                 alarm_type=item.get('AlarmType', ''),
-                timestamp=item.get('Timestamp', datetime.now()),
+                timestamp=item.get('Timestamp') or datetime.now(),
                 history_item_type=item.get('HistoryItemType', ''),
                 history_summary=item.get('HistorySummary', ''),
                 old_state=None,
@@ -531,10 +606,11 @@ class CloudWatchAlarmsTools:
             suggestions = []
 
             # Filter for state transitions to ALARM state
-            alarm_transitions = []
-            for item in history_items:
-                if item.history_item_type == 'StateUpdate' and item.new_state == 'ALARM':
-                    alarm_transitions.append(item)
+            alarm_transitions = [
+                item
+                for item in history_items
+                if item.history_item_type == 'StateUpdate' and item.new_state == 'ALARM'
+            ]
 
             if not alarm_transitions:
                 logger.info('No transitions to ALARM state found')
@@ -624,25 +700,9 @@ class CloudWatchAlarmsTools:
             if component_alarms:
                 logger.info(f'Found {len(component_alarms)} component alarms')
 
-                for component_name in component_alarms:
-                    try:
-                        component_detail = await self._get_alarm_details(
-                            cloudwatch_client, component_name
-                        )
-                        component_details.append(component_detail)
-                    except Exception as e:
-                        logger.warning(
-                            f'Failed to get details for component alarm {component_name}: {str(e)}'
-                        )
-                        # Add basic details for failed component
-                        component_details.append(
-                            AlarmDetails(
-                                alarm_name=component_name,
-                                alarm_type='Unknown',
-                                current_state='Unknown',
-                                alarm_description=f'Failed to retrieve details: {str(e)}',
-                            )
-                        )
+                component_details = await self._get_component_alarm_details(
+                    cloudwatch_client, component_alarms
+                )
 
             return CompositeAlarmComponentResponse(
                 composite_alarm_name=alarm_details.alarm_name,
@@ -669,8 +729,6 @@ class CloudWatchAlarmsTools:
 
             # Simple regex-based parsing to extract alarm names
             # Composite alarm rules typically contain alarm names in quotes or as identifiers
-            import re
-
             # Pattern to match alarm names in various formats:
             # - Quoted names: "alarm-name"
             # - ALARM() function: ALARM("alarm-name")
@@ -15,10 +15,7 @@
 """CloudWatch Logs tools for MCP server."""
 
 import asyncio
-import boto3
-import datetime
 import os
-from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
 from awslabs.cloudwatch_mcp_server.cloudwatch_logs.models import (
     LogAnomaly,
     LogAnomalyDetector,
@@ -30,16 +27,31 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_logs.models import (
     SavedLogsInsightsQuery,
 )
 from awslabs.cloudwatch_mcp_server.common import (
+    BotoClientCache,
     clean_up_pattern,
     filter_by_prefixes,
+    parse_iso8601,
     remove_null_values,
 )
-from botocore.config import Config
 from loguru import logger
 from mcp.server.fastmcp import Context
-from pydantic import Field
+from pydantic import Field, TypeAdapter
 from timeit import default_timer as timer
-from typing import Annotated, Dict, List, Literal, Optional
+from typing import Annotated, Dict, List, Literal, Optional, Tuple
+
+
+# Upper bound on anomaly detectors paged concurrently by analyze_log_group
+MAX_CONCURRENT_DETECTOR_SCANS = 8
+
+# Log group listings change on the order of minutes, so identical describe_log_groups calls
+# within this many seconds are answered from memory instead of re-paginating the APIs
+DESCRIBE_LOG_GROUPS_CACHE_TTL_SECONDS = 30
+
+# Validators for whole API result lists, built once so each response is validated in one call
+LOG_GROUP_LIST_ADAPTER = TypeAdapter(List[LogGroupMetadata])
+SAVED_QUERY_LIST_ADAPTER = TypeAdapter(List[SavedLogsInsightsQuery])
+ANOMALY_DETECTOR_LIST_ADAPTER = TypeAdapter(List[LogAnomalyDetector])
+ANOMALY_LIST_ADAPTER = TypeAdapter(List[LogAnomaly])
 
 
 class CloudWatchLogsTools:
@@ -47,32 +59,36 @@ class CloudWatchLogsTools:
 
     def __init__(self):
         """Initialize the CloudWatch Logs tools."""
-        self._logs_client = None
-        self._logs_client_region = None
+        self._clients = BotoClientCache('logs')
+        self._describe_log_groups_cache: Dict[Tuple, Tuple[float, LogsMetadata]] = {}
 
     @property
     def logs_client(self):
         """Get the logs client for the default region (us-east-1)."""
-        if self._logs_client is None or self._logs_client_region != 'us-east-1':
-            self._logs_client = self._get_logs_client('us-east-1')
-            self._logs_client_region = 'us-east-1'
-        return self._logs_client
+        return self._get_logs_client('us-east-1')
 
     def _get_logs_client(self, region: str):
-        """Create a CloudWatch Logs client for the specified region."""
-        config = Config(user_agent_extra=f'awslabs/mcp/cloudwatch-mcp-server/{MCP_SERVER_VERSION}')
-
+        """Get a cached CloudWatch Logs client for the specified region."""
         try:
-            if aws_profile := os.environ.get('AWS_PROFILE'):
-                return boto3.Session(profile_name=aws_profile, region_name=region).client(
-                    'logs', config=config
-                )
-            else:
-                return boto3.Session(region_name=region).client('logs', config=config)
+            return self._clients.get(region)
         except Exception as e:
             logger.error(f'Error creating cloudwatch logs client for region {region}: {str(e)}')
             raise
 
+    def close(self):
+        """Close all cached clients and release their HTTP connection pools."""
+        self._clients.close()
+
+    def _cache_describe_log_groups(self, cache_key: Tuple, result: LogsMetadata):
+        """Store a describe_log_groups result, dropping any entries that have expired."""
+        now = timer()
+        self._describe_log_groups_cache = {
+            key: entry
+            for key, entry in self._describe_log_groups_cache.items()
+            if now - entry[0] < DESCRIBE_LOG_GROUPS_CACHE_TTL_SECONDS
+        }
+        self._describe_log_groups_cache[cache_key] = (now, result)
+
     def _validate_log_group_parameters(
         self, log_group_names: Optional[List[str]], log_group_identifiers: Optional[List[str]]
     ) -> None:
@@ -99,7 +115,7 @@ class CloudWatchLogsTools:
         Returns:
             Unix timestamp as integer
         """
-        return int(datetime.datetime.fromisoformat(time_str).timestamp())
+        return int(parse_iso8601(time_str).timestamp())
 
     def _build_logs_query_params(
         self,
@@ -168,7 +184,7 @@ class CloudWatchLogsTools:
         """
         poll_start = timer()
         while poll_start + max_timeout > timer():
-            response = logs_client.get_query_results(queryId=query_id)
+            response = await asyncio.to_thread(logs_client.get_query_results, queryId=query_id)
             status = response['status']
 
             if status in {'Complete', 'Failed', 'Cancelled'}:
@@ -268,6 +284,19 @@ class CloudWatchLogsTools:
                 - logGroupArn: The Amazon Resource Name (ARN) of the log group. This version of the ARN doesn't include a trailing :* after the log group name.
             Any saved queries that are applicable to the returned log groups are also included.
         """
+        cache_key = (
+            region,
+            os.environ.get('AWS_PROFILE'),
+            tuple(account_identifiers or ()),
+            include_linked_accounts,
+            log_group_class,
+            log_group_name_prefix,
+            max_items,
+        )
+        cached = self._describe_log_groups_cache.get(cache_key)
+        if cached is not None and timer() - cached[0] < DESCRIBE_LOG_GROUPS_CACHE_TTL_SECONDS:
+            return cached[1]
+
         # Create logs client for the specified region
         logs_client = self._get_logs_client(region)
 
@@ -287,8 +316,8 @@ class CloudWatchLogsTools:
             for page in paginator.paginate(**remove_null_values(kwargs)):
                 log_groups.extend(page.get('logGroups', []))
 
-            logger.info(f'Log groups: {log_groups}')
-            return [LogGroupMetadata.model_validate(lg) for lg in log_groups]
+            logger.debug('Log groups: {}', log_groups)
+            return LOG_GROUP_LIST_ADAPTER.validate_python(log_groups)
 
         def get_filtered_saved_queries(
             log_groups: List[LogGroupMetadata],
@@ -307,10 +336,8 @@ class CloudWatchLogsTools:
 
                 next_token = response.get('nextToken')
 
-            logger.info(f'Saved queries: {saved_queries}')
-            modeled_queries = [
-                SavedLogsInsightsQuery.model_validate(saved_query) for saved_query in saved_queries
-            ]
+            logger.debug('Saved queries: {}', saved_queries)
+            modeled_queries = SAVED_QUERY_LIST_ADAPTER.validate_python(saved_queries)
 
             log_group_targets = {lg.logGroupName for lg in log_groups}
             # filter to only saved queries applicable to log groups we're looking at
@@ -322,11 +349,16 @@ class CloudWatchLogsTools:
             ]
 
         try:
-            log_groups = describe_log_groups()
-            filtered_saved_queries = get_filtered_saved_queries(log_groups)
-            return LogsMetadata(
+            # boto3 is synchronous, so run the paginated calls off the event loop
+            log_groups = await asyncio.to_thread(describe_log_groups)
+            filtered_saved_queries = await asyncio.to_thread(
+                get_filtered_saved_queries, log_groups
+            )
+            result = LogsMetadata(
                 log_group_metadata=log_groups, saved_queries=filtered_saved_queries
             )
+            self._cache_describe_log_groups(cache_key, result)
+            return result
 
         except Exception as e:
             logger.error(f'Error in describe_log_groups_tool: {str(e)}')
@@ -379,14 +411,20 @@ class CloudWatchLogsTools:
             - top_patterns_containing_errors: Results of the query for patterns containing error-related terms
                 (error, exception, fail, timeout, fatal)
         """
+        # Parse the query window once instead of once per anomaly
+        try:
+            window = (parse_iso8601(start_time), parse_iso8601(end_time))
+        except ValueError:
+            window = None
 
         def is_applicable_anomaly(anomaly: LogAnomaly) -> bool:
             # Must have overlap - convert to datetime objects for proper comparison
             try:
-                anomaly_first_seen = datetime.datetime.fromisoformat(anomaly.firstSeen)
-                anomaly_last_seen = datetime.datetime.fromisoformat(anomaly.lastSeen)
-                end_time_dt = datetime.datetime.fromisoformat(end_time)
-                start_time_dt = datetime.datetime.fromisoformat(start_time)
+                if window is None:
+                    raise ValueError(f'Invalid time window: {start_time} to {end_time}')
+                start_time_dt, end_time_dt = window
+                anomaly_first_seen = parse_iso8601(anomaly.firstSeen)
+                anomaly_last_seen = parse_iso8601(anomaly.lastSeen)
 
                 if anomaly_first_seen > end_time_dt or anomaly_last_seen < start_time_dt:
                     return False
@@ -402,31 +440,47 @@ class CloudWatchLogsTools:
         # Create logs client for the specified region
         logs_client = self._get_logs_client(region)
 
-        async def get_applicable_anomalies() -> LogAnomalyResults:
-            detectors: List[LogAnomalyDetector] = []
+        def list_anomaly_detectors() -> List[LogAnomalyDetector]:
             paginator = logs_client.get_paginator('list_log_anomaly_detectors')
-            for page in paginator.paginate(filterLogGroupArn=log_group_arn):
-                detectors.extend(
-                    [
-                        LogAnomalyDetector.model_validate(d)
-                        for d in page.get('anomalyDetectors', [])
-                    ]
-                )
+            return ANOMALY_DETECTOR_LIST_ADAPTER.validate_python(
+                [
+                    d
+                    for page in paginator.paginate(filterLogGroupArn=log_group_arn)
+                    for d in page.get('anomalyDetectors', [])
+                ]
+            )
+
+        def list_detector_anomalies(detector_arn: str) -> List[LogAnomaly]:
+            paginator = logs_client.get_paginator('list_anomalies')
+            return ANOMALY_LIST_ADAPTER.validate_python(
+                [
+                    anomaly
+                    for page in paginator.paginate(
+                        anomalyDetectorArn=detector_arn, suppressionState='UNSUPPRESSED'
+                    )
+                    for anomaly in page.get('anomalies', [])
+                ]
+            )
+
+        async def get_applicable_anomalies() -> LogAnomalyResults:
+            detectors = await asyncio.to_thread(list_anomaly_detectors)
 
             logger.info(f'Found {len(detectors)} anomaly detectors for log group')
 
-            # 2 & 3. Get and filter anomalies for each detector
-            anomalies: List[LogAnomaly] = []
-            for detector in detectors:
-                paginator = logs_client.get_paginator('list_anomalies')
+            # 2 & 3. Get and filter anomalies for each detector, paging detectors concurrently
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_DETECTOR_SCANS)
 
-                for page in paginator.paginate(
-                    anomalyDetectorArn=detector.anomalyDetectorArn, suppressionState='UNSUPPRESSED'
-                ):
-                    anomalies.extend(
-                        LogAnomaly.model_validate(anomaly) for anomaly in page.get('anomalies', [])
+            async def get_detector_anomalies(detector: LogAnomalyDetector) -> List[LogAnomaly]:
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        list_detector_anomalies, detector.anomalyDetectorArn
                     )
 
+            detector_anomalies = await asyncio.gather(
+                *(get_detector_anomalies(detector) for detector in detectors)
+            )
+            anomalies = [anomaly for batch in detector_anomalies for anomaly in batch]
+
             applicable_anomalies = [
                 anomaly for anomaly in anomalies if is_applicable_anomaly(anomaly)
             ]
@@ -567,7 +621,9 @@ class CloudWatchLogsTools:
             logs_client = self._get_logs_client(region)
 
             # Start the query
-            start_response = logs_client.start_query(**remove_null_values(kwargs))
+            start_response = await asyncio.to_thread(
+                logs_client.start_query, **remove_null_values(kwargs)
+            )
             query_id = start_response['queryId']
             logger.info(f'Started query with ID: {query_id}')
 
@@ -608,7 +664,7 @@ class CloudWatchLogsTools:
             # Create logs client for the specified region
             logs_client = self._get_logs_client(region)
 
-            response = logs_client.get_query_results(queryId=query_id)
+            response = await asyncio.to_thread(logs_client.get_query_results, queryId=query_id)
 
             logger.info(f'Retrieved results for query ID {query_id}')
 
@@ -643,7 +699,7 @@ class CloudWatchLogsTools:
             # Create logs client for the specified region
             logs_client = self._get_logs_client(region)
 
-            response = logs_client.stop_query(queryId=query_id)
+            response = await asyncio.to_thread(logs_client.stop_query, queryId=query_id)
             return LogsQueryCancelResult.model_validate(response)
         except Exception as e:
             logger.error(f'Error in cancel_query_tool: {str(e)}')
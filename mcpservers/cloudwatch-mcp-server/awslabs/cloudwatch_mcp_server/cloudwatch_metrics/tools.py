@@ -14,10 +14,7 @@
 
 """CloudWatch Metrics tools for MCP server."""
 
-import boto3
-import json
-import os
-from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
+import asyncio
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     AlarmRecommendation,
     AlarmRecommendationDimension,
@@ -29,12 +26,13 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     MetricMetadata,
     MetricMetadataIndexKey,
 )
-from botocore.config import Config
+from awslabs.cloudwatch_mcp_server.common import BotoClientCache, parse_iso8601
 from datetime import datetime
 from loguru import logger
 from mcp.server.fastmcp import Context
 from pathlib import Path
 from pydantic import Field
+from pydantic_core import from_json
 from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
 
@@ -43,6 +41,8 @@ class CloudWatchMetricsTools:
 
     def __init__(self):
         """Initialize the CloudWatch Metrics tools."""
+        self._clients = BotoClientCache('cloudwatch')
+
         # Load and index metric metadata
         self.metric_metadata_index: Dict[MetricMetadataIndexKey, Any] = (
             self._load_and_index_metadata()
@@ -50,20 +50,17 @@ class CloudWatchMetricsTools:
         logger.info(f'Loaded {len(self.metric_metadata_index)} metric metadata entries')
 
     def _get_cloudwatch_client(self, region: str):
-        """Create a CloudWatch client for the specified region."""
-        config = Config(user_agent_extra=f'awslabs/mcp/cloudwatch-mcp-server/{MCP_SERVER_VERSION}')
-
+        """Get a cached CloudWatch client for the specified region."""
         try:
-            if aws_profile := os.environ.get('AWS_PROFILE'):
-                return boto3.Session(profile_name=aws_profile, region_name=region).client(
-                    'cloudwatch', config=config
-                )
-            else:
-                return boto3.Session(region_name=region).client('cloudwatch', config=config)
+            return self._clients.get(region)
         except Exception as e:
             logger.error(f'Error creating cloudwatch client for region {region}: {str(e)}')
             raise
 
+    def close(self):
+        """Close all cached clients and release their HTTP connection pools."""
+        self._clients.close()
+
     def _load_and_index_metadata(self) -> Dict[MetricMetadataIndexKey, Any]:
         """Load metric metadata from JSON file and create an indexed structure.
 
@@ -82,7 +79,7 @@ class CloudWatchMetricsTools:
 
             # Load the JSON data
             with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata_list = json.load(f)
+                metadata_list = from_json(f.read())
 
             logger.info(f'Loaded {len(metadata_list)} metric metadata entries')
 
@@ -352,9 +349,13 @@ class CloudWatchMetricsTools:
             # Create CloudWatch client for the specified region
             cloudwatch_client = self._get_cloudwatch_client(region)
 
-            # Call the GetMetricData API
-            response = cloudwatch_client.get_metric_data(
-                MetricDataQueries=[metric_query], StartTime=start_time, EndTime=end_time
+            # Call the GetMetricData API, letting CloudWatch return datapoints oldest first
+            response = await asyncio.to_thread(
+                cloudwatch_client.get_metric_data,
+                MetricDataQueries=[metric_query],
+                StartTime=start_time,
+                EndTime=end_time,
+                ScanBy='TimestampAscending',
             )
 
             # Process the response
@@ -369,12 +370,12 @@ class CloudWatchMetricsTools:
         """Process time parameters and calculate the period."""
         # Convert string times to datetime objects
         if isinstance(start_time, str):
-            start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+            start_time = parse_iso8601(start_time)
 
         if end_time is None:
             end_time = datetime.utcnow()
         elif isinstance(end_time, str):
-            end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+            end_time = parse_iso8601(end_time)
 
         # Calculate period based on time window and target datapoints
         time_window_seconds = int((end_time - start_time).total_seconds())
@@ -491,20 +492,19 @@ class CloudWatchMetricsTools:
         }
 
     def _process_metric_data_response(self, response):
-        """Process the GetMetricData API response."""
+        """Process the GetMetricData API response.
+
+        Datapoints are kept in the order CloudWatch returns them, which is ascending by timestamp
+        because get_metric_data requests ScanBy='TimestampAscending'.
+        """
         metric_data_results = []
 
         for result in response.get('MetricDataResults', []):
             # Process timestamps and values into data points
-            datapoints = []
-            timestamps = result.get('Timestamps', [])
-            values = result.get('Values', [])
-
-            for ts, val in zip(timestamps, values):
-                datapoints.append(MetricDataPoint(timestamp=ts, value=val))
-
-            # Sort datapoints by timestamp
-            datapoints.sort(key=lambda x: x.timestamp)
+            datapoints = [
+                MetricDataPoint(timestamp=ts, value=val)
+                for ts, val in zip(result.get('Timestamps', []), result.get('Values', []))
+            ]
 
             # Create the metric data result
             metric_result = MetricDataResult(
@@ -798,13 +798,13 @@ class CloudWatchMetricsTools:
         )
 
         # Parse dimensions
-        dimensions = []
-        for dim_data in alarm_data.get('dimensions', []):
-            alarm_dim = AlarmRecommendationDimension(
+        dimensions = [
+            AlarmRecommendationDimension(
                 name=dim_data.get('name', ''),
                 value=dim_data.get('value') if 'value' in dim_data else None,
             )
-            dimensions.append(alarm_dim)
+            for dim_data in alarm_data.get('dimensions', [])
+        ]
 
         # Create alarm recommendation
         return AlarmRecommendation(
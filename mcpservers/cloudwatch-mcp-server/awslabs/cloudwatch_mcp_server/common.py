@@ -12,9 +12,59 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import boto3
 import datetime
-import json
-from typing import Dict, List, Set
+import os
+from awslabs.cloudwatch_mcp_server import MCP_SERVER_VERSION
+from botocore.config import Config
+from pydantic_core import from_json
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+UTC = datetime.timezone.utc
+
+# Shared botocore config for every CloudWatch client, built once at import time
+BOTO_CLIENT_CONFIG = Config(
+    user_agent_extra=f'awslabs/mcp/cloudwatch-mcp-server/{MCP_SERVER_VERSION}'
+)
+
+
+class BotoClientCache:
+    """Cache of boto3 clients for one AWS service.
+
+    One boto3 Session is kept per AWS profile, so the credential provider chain is resolved once
+    rather than once per region, and one client is kept per (region, profile) so repeated tool
+    calls reuse the client's HTTP connection pool.
+    """
+
+    def __init__(self, service_name: str):
+        """Initialize an empty cache for the given service name."""
+        self.service_name = service_name
+        self._sessions: Dict[Optional[str], boto3.Session] = {}
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+
+    def get(self, region: str):
+        """Return the cached client for the region and current AWS_PROFILE, creating it if needed."""
+        aws_profile = os.environ.get('AWS_PROFILE')
+        cache_key = (region, aws_profile)
+        client = self._clients.get(cache_key)
+        if client is not None:
+            return client
+
+        session = self._sessions.get(aws_profile)
+        if session is None:
+            session = boto3.Session(profile_name=aws_profile) if aws_profile else boto3.Session()
+            self._sessions[aws_profile] = session
+
+        client = session.client(self.service_name, region_name=region, config=BOTO_CLIENT_CONFIG)
+        self._clients[cache_key] = client
+        return client
+
+    def close(self):
+        """Close all cached clients and release their HTTP connection pools."""
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
 
 
 def remove_null_values(d: Dict):
@@ -27,15 +77,20 @@ def filter_by_prefixes(strings: Set[str], prefixes: Set[str]) -> Set[str]:
     return {s for s in strings if any(s.startswith(p) for p in prefixes)}
 
 
+def parse_iso8601(value: str) -> datetime.datetime:
+    """Parse an ISO 8601 timestamp string, accepting a trailing 'Z' as UTC.
+
+    datetime.fromisoformat only understands 'Z' from Python 3.11, so the suffix is rewritten
+    here; other strings are passed through without copying.
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    return datetime.datetime.fromisoformat(value)
+
+
 def epoch_ms_to_utc_iso(ms: int) -> str:
-    """Convert milliseconds since epoch to an ISO 8601 timestamp string."""
-    # Use replace to convert 'Z' suffix to '+00:00' for compatibility with fromisoformat()
-    iso_string = datetime.datetime.fromtimestamp(ms / 1000.0, tz=datetime.timezone.utc).isoformat()
-    # Ensure the timezone is represented as +00:00 instead of +00:00 (if it's already that way)
-    # or convert Z to +00:00 if the isoformat() method ever returns Z
-    if iso_string.endswith('Z'):
-        iso_string = iso_string[:-1] + '+00:00'
-    return iso_string
+    """Convert milliseconds since epoch to an ISO 8601 timestamp string with a +00:00 offset."""
+    return datetime.datetime.fromtimestamp(ms / 1000.0, UTC).isoformat()
 
 
 def clean_up_pattern(pattern_result: List[Dict[str, str]]):
@@ -48,4 +103,4 @@ def clean_up_pattern(pattern_result: List[Dict[str, str]]):
         entry.pop('@tokens', None)
         entry.pop('@visualization', None)
         # limit to 1 sample
-        entry['@logSamples'] = json.loads(entry.get('@logSamples', '[]'))[:1]
+        entry['@logSamples'] = from_json(entry.get('@logSamples', '[]'))[:1]
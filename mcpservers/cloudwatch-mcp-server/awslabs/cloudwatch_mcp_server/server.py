@@ -14,6 +14,9 @@
 
 """awslabs cloudwatch MCP Server implementation."""
 
+import anyio
+import os
+import sys
 from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools import CloudWatchAlarmsTools
 from awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools import CloudWatchLogsTools
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools import CloudWatchMetricsTools
@@ -62,13 +65,35 @@ async def cloudwatch_health_check(request: Request) -> PlainTextResponse:
     return PlainTextResponse("CloudWatch MCP Server - OK")
 
 
+def _anyio_backend_options() -> dict:
+    """Return anyio backend options that select uvloop when it is installed, else the stdlib loop."""
+    try:
+        import uvloop  # noqa: F401
+    except ImportError:
+        return {}
+    return {'use_uvloop': True}
+
+
 def main():
     """Run the MCP server."""
+    # Honour FASTMCP_LOG_LEVEL in loguru too; the log group and saved query dumps are DEBUG
+    # records. Done here rather than at import, so importing the module keeps the host's sinks
+    logger.remove()
+    logger.add(sys.stderr, level=os.getenv('FASTMCP_LOG_LEVEL', 'WARNING'))
+
     # Configure the MCP server settings for container deployment
     mcp.settings.host = "0.0.0.0"
     mcp.settings.port = 8000
     
-    mcp.run(transport="streamable-http")
+    try:
+        # mcp.run() would start anyio on the stdlib loop, and uvicorn serves on whichever loop
+        # it is awaited from, so its loop="auto" setting never gets to pick uvloop
+        anyio.run(mcp.run_streamable_http_async, backend_options=_anyio_backend_options())
+    finally:
+        # Release the cached AWS clients' connection pools on shutdown
+        cloudwatch_logs_tools.close()
+        cloudwatch_metrics_tools.close()
+        cloudwatch_alarms_tools.close()
     logger.info('CloudWatch MCP server started')
 
 
@@ -17,6 +17,7 @@
 import pytest
 from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.models import ActiveAlarmsResponse
 from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools import CloudWatchAlarmsTools
+from awslabs.cloudwatch_mcp_server.common import BotoClientCache
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -37,14 +38,12 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_max_items_validation_valid(self, mock_context):
         """Test max_items parameter validation with valid values."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [{'MetricAlarms': [], 'CompositeAlarms': []}]
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
 
@@ -58,11 +57,9 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_max_items_validation_invalid(self, mock_context):
         """Test max_items parameter validation with invalid values."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
 
@@ -76,9 +73,7 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_no_max_items_works_correctly(self, mock_context):
         """Test that boto3 paginator is used correctly."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [
@@ -100,7 +95,7 @@ class TestGetActiveAlarms:
                 }
             ]
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
             result = await alarms_tools.get_active_alarms(mock_context)
@@ -121,9 +116,7 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_paginator_usage(self, mock_context):
         """Test that boto3 paginator is used correctly."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [
@@ -145,7 +138,7 @@ class TestGetActiveAlarms:
                 }
             ]
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
             result = await alarms_tools.get_active_alarms(mock_context, max_items=50)
@@ -187,12 +180,10 @@ class TestGetActiveAlarms:
         mock_mcp = Mock()
 
         # Mock boto3 session to avoid AWS credential errors
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             # Setup mock client
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Create a CloudWatchAlarmsTools instance
             alarms_tools = CloudWatchAlarmsTools()
@@ -214,14 +205,12 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_empty_alarms_response(self, mock_context):
         """Test handling of empty alarms response."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [{'MetricAlarms': [], 'CompositeAlarms': []}]
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
             result = await alarms_tools.get_active_alarms(mock_context, max_items=50)
@@ -235,9 +224,7 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_mixed_alarm_types_response(self, mock_context):
         """Test response with both metric and composite alarms."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [
@@ -267,7 +254,7 @@ class TestGetActiveAlarms:
                 }
             ]
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
             result = await alarms_tools.get_active_alarms(mock_context, max_items=50)
@@ -281,9 +268,7 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_has_more_results_logic(self, mock_context):
         """Test has_more_results logic when max_items is exceeded."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             # Return 3 alarms when max_items=2
@@ -328,7 +313,7 @@ class TestGetActiveAlarms:
                 }
             ]
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
             result = await alarms_tools.get_active_alarms(mock_context, max_items=2)
@@ -344,9 +329,8 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_boto3_client_error_handling(self, mock_context):
         """Test error handling when boto3 client fails."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session',
-            side_effect=Exception('AWS credentials not found'),
+        with patch.object(
+            BotoClientCache, 'get', side_effect=Exception('AWS credentials not found')
         ):
             alarms_tools = CloudWatchAlarmsTools()
             with pytest.raises(Exception, match='AWS credentials not found'):
@@ -355,14 +339,12 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_describe_alarms_api_error(self, mock_context):
         """Test error handling when describe_alarms API fails."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             mock_paginator.paginate.side_effect = Exception('API Error')
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
 
@@ -375,9 +357,7 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_alarm_transformation_with_missing_fields(self, mock_context):
         """Test alarm transformation handles missing optional fields gracefully."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             # Alarm with minimal required fields
@@ -400,7 +380,7 @@ class TestGetActiveAlarms:
                 }
             ]
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
             result = await alarms_tools.get_active_alarms(mock_context, max_items=50)
@@ -422,9 +402,7 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_pagination_across_multiple_pages(self, mock_context):
         """Test pagination handling across multiple pages."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             # Simulate multiple pages
@@ -463,7 +441,7 @@ class TestGetActiveAlarms:
                 },
             ]
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
             result = await alarms_tools.get_active_alarms(mock_context, max_items=5)
@@ -476,9 +454,7 @@ class TestGetActiveAlarms:
     @pytest.mark.asyncio
     async def test_dimension_transformation(self, mock_context):
         """Test proper transformation of alarm dimensions."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [
@@ -503,7 +479,7 @@ class TestGetActiveAlarms:
                 }
             ]
             mock_client.get_paginator.return_value = mock_paginator
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
             result = await alarms_tools.get_active_alarms(mock_context, max_items=50)
@@ -518,11 +494,9 @@ class TestGetActiveAlarms:
 
     def test_transform_metric_alarm_direct(self):
         """Test _transform_metric_alarm method directly."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
 
@@ -549,11 +523,9 @@ class TestGetActiveAlarms:
 
     def test_transform_composite_alarm_direct(self):
         """Test _transform_composite_alarm method directly."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
 
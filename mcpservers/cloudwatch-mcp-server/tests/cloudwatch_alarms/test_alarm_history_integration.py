@@ -21,6 +21,7 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.models import (
     CompositeAlarmComponentResponse,
 )
 from awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools import CloudWatchAlarmsTools
+from awslabs.cloudwatch_mcp_server.common import BotoClientCache
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -167,11 +168,9 @@ class TestAlarmHistoryIntegration:
         self, mock_context, realistic_alarm_history_response, realistic_metric_alarm
     ):
         """Test complete end-to-end alarm history retrieval for metric alarm."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Setup realistic API responses - simulate more items than max_items (50)
             # Create a response with 51 items to trigger has_more_results=True
@@ -254,26 +253,21 @@ class TestAlarmHistoryIntegration:
         self, mock_context, realistic_composite_alarm, realistic_metric_alarm
     ):
         """Test complete composite alarm handling with component expansion."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Setup composite alarm response
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [{'AlarmHistoryItems': []}]
             mock_client.get_paginator.return_value = mock_paginator
 
-            # First call returns composite alarm, subsequent calls return component alarms
+            # First call returns composite alarm, second call returns all components in one batch
             describe_calls = [
                 {'MetricAlarms': [], 'CompositeAlarms': [realistic_composite_alarm]},
-                {  # For web-server-cpu-alarm
-                    'MetricAlarms': [realistic_metric_alarm],
-                    'CompositeAlarms': [],
-                },
-                {  # For database-connection-alarm
+                {
                     'MetricAlarms': [
+                        realistic_metric_alarm,
                         {
                             'AlarmName': 'database-connection-alarm',
                             'AlarmDescription': 'Database connection monitoring',
@@ -285,12 +279,7 @@ class TestAlarmHistoryIntegration:
                             'EvaluationPeriods': 1,
                             'Period': 300,
                             'Statistic': 'Average',
-                        }
-                    ],
-                    'CompositeAlarms': [],
-                },
-                {  # For maintenance-mode-alarm
-                    'MetricAlarms': [
+                        },
                         {
                             'AlarmName': 'maintenance-mode-alarm',
                             'AlarmDescription': 'Maintenance mode indicator',
@@ -302,7 +291,7 @@ class TestAlarmHistoryIntegration:
                             'EvaluationPeriods': 1,
                             'Period': 60,
                             'Statistic': 'Maximum',
-                        }
+                        },
                     ],
                     'CompositeAlarms': [],
                 },
@@ -340,17 +329,22 @@ class TestAlarmHistoryIntegration:
             assert 'web-server-cpu-alarm' in component_names
             assert 'database-connection-alarm' in component_names
             assert 'maintenance-mode-alarm' in component_names
+            assert all(detail.alarm_type == 'MetricAlarm' for detail in result.component_details)
+
+            # Components are fetched with a single batched DescribeAlarms call
+            assert mock_client.describe_alarms.call_count == 2
+            assert set(mock_client.describe_alarms.call_args[1]['AlarmNames']) == set(
+                expected_components
+            )
 
     @pytest.mark.asyncio
     async def test_pagination_handling(
         self, mock_context, realistic_alarm_history_response, realistic_metric_alarm
     ):
         """Test pagination handling in alarm history."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Setup paginated response - simulate more items than max_items (50)
             extended_response = realistic_alarm_history_response.copy()
@@ -388,11 +382,9 @@ class TestAlarmHistoryIntegration:
     @pytest.mark.asyncio
     async def test_different_history_item_types(self, mock_context, realistic_metric_alarm):
         """Test handling of different history item types."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Setup response with different item types
             mixed_history_response = {
@@ -462,11 +454,9 @@ class TestAlarmHistoryIntegration:
     @pytest.mark.asyncio
     async def test_error_scenarios_integration(self, mock_context):
         """Test various error scenarios in integration context."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             alarms_tools = CloudWatchAlarmsTools()
 
@@ -487,11 +477,9 @@ class TestAlarmHistoryIntegration:
     @pytest.mark.asyncio
     async def test_time_range_edge_cases(self, mock_context, realistic_metric_alarm):
         """Test edge cases in time range handling."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [{'AlarmHistoryItems': []}]
@@ -527,7 +515,7 @@ class TestAlarmHistoryIntegration:
 
     def test_complex_alarm_rule_parsing(self):
         """Test parsing of complex composite alarm rules."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             alarms_tools = CloudWatchAlarmsTools()
 
             # Test complex real-world alarm rules
@@ -553,11 +541,9 @@ class TestAlarmHistoryIntegration:
     @pytest.mark.asyncio
     async def test_performance_with_large_history(self, mock_context, realistic_metric_alarm):
         """Test performance considerations with large alarm history."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             # Create large history response (simulating busy alarm)
             base_time = datetime(2025, 6, 20, 10, 0, 0)
@@ -620,14 +606,12 @@ class TestAlarmHistoryIntegration:
         fixed_now = datetime(2025, 6, 20, 15, 30, 0)
         expected_start = fixed_now - timedelta(hours=24)
 
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             with patch(
                 'awslabs.cloudwatch_mcp_server.cloudwatch_alarms.tools.datetime'
             ) as mock_datetime:
                 mock_client = Mock()
-                mock_session.return_value.client.return_value = mock_client
+                mock_get_client.return_value = mock_client
 
                 # Mock datetime.now() to return fixed time
                 mock_datetime.now.return_value = fixed_now
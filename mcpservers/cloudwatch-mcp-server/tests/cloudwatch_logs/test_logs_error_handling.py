@@ -17,6 +17,7 @@
 import pytest
 import pytest_asyncio
 from awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools import CloudWatchLogsTools
+from awslabs.cloudwatch_mcp_server.common import BOTO_CLIENT_CONFIG, BotoClientCache
 from unittest.mock import AsyncMock, Mock, patch
 
 
@@ -35,7 +36,7 @@ class TestParameterValidation:
 
     def test_validate_log_group_parameters_both_provided(self):
         """Test validation when both parameters are provided - should raise error."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchLogsTools()
 
             with pytest.raises(ValueError) as exc_info:
@@ -48,7 +49,7 @@ class TestParameterValidation:
 
     def test_validate_log_group_parameters_neither_provided(self):
         """Test validation when neither parameter is provided - should raise error."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchLogsTools()
 
             with pytest.raises(ValueError) as exc_info:
@@ -61,7 +62,7 @@ class TestParameterValidation:
 
     def test_validate_log_group_parameters_valid_cases(self):
         """Test validation with valid parameter combinations."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchLogsTools()
 
             # Should not raise - only log_group_names provided
@@ -72,7 +73,7 @@ class TestParameterValidation:
 
     def test_convert_time_to_timestamp(self):
         """Test time string to timestamp conversion."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchLogsTools()
 
             # Test valid ISO 8601 time
@@ -82,7 +83,7 @@ class TestParameterValidation:
 
     def test_build_logs_query_params(self):
         """Test building logs query parameters."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchLogsTools()
 
             params = tools._build_logs_query_params(
@@ -103,7 +104,7 @@ class TestParameterValidation:
 
     def test_process_query_results(self):
         """Test processing query results."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchLogsTools()
 
             raw_response = {
@@ -133,12 +134,10 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_describe_log_groups_api_error(self, mock_context):
         """Test describe_log_groups with API error - covers lines 367-371."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.get_paginator.side_effect = Exception('API Error')
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchLogsTools()
 
@@ -151,12 +150,10 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_analyze_log_group_api_error(self, mock_context):
         """Test analyze_log_group with API error - covers lines 374-376, 379, 382."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.get_paginator.side_effect = Exception('Anomaly API Error')
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchLogsTools()
 
@@ -176,12 +173,10 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_execute_log_insights_query_api_error(self, mock_context):
         """Test execute_log_insights_query with API error - covers lines 455-458."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.start_query.side_effect = Exception('Query API Error')
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchLogsTools()
 
@@ -203,12 +198,10 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_get_logs_insight_query_results_api_error(self, mock_context):
         """Test get_logs_insight_query_results with API error - covers lines 579-582."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.get_query_results.side_effect = Exception('Query Results API Error')
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchLogsTools()
 
@@ -221,12 +214,10 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_cancel_logs_insight_query_api_error(self, mock_context):
         """Test cancel_logs_insight_query with API error - covers lines 604-607."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.stop_query.side_effect = Exception('Cancel Query API Error')
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchLogsTools()
 
@@ -239,13 +230,11 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_poll_for_query_completion_timeout(self, mock_context):
         """Test polling timeout scenario."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             # Always return 'Running' status to trigger timeout
             mock_client.get_query_results.return_value = {'status': 'Running', 'results': []}
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
             tools = CloudWatchLogsTools()
             # Use very short timeout to trigger timeout quickly
             result = await tools._poll_for_query_completion(
@@ -259,16 +248,14 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_poll_for_query_completion_failed_status(self, mock_context):
         """Test polling with failed query status."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.get_query_results.return_value = {
                 'queryId': 'test-query-id',
                 'status': 'Failed',
                 'results': [],
             }
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
             tools = CloudWatchLogsTools()
             result = await tools._poll_for_query_completion(
                 mock_client, 'test-query-id', 30, mock_context
@@ -279,16 +266,14 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_poll_for_query_completion_cancelled_status(self, mock_context):
         """Test polling with cancelled query status."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.get_query_results.return_value = {
                 'queryId': 'test-query-id',
                 'status': 'Cancelled',
                 'results': [],
             }
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
             tools = CloudWatchLogsTools()
             result = await tools._poll_for_query_completion(
                 mock_client, 'test-query-id', 30, mock_context
@@ -302,7 +287,7 @@ class TestEdgeCases:
 
     def test_process_query_results_missing_fields(self):
         """Test processing query results with missing optional fields."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchLogsTools()
 
             # Response with minimal fields
@@ -321,9 +306,7 @@ class TestEdgeCases:
     def test_aws_profile_initialization(self):
         """Test initialization with AWS_PROFILE environment variable."""
         with patch.dict('os.environ', {'AWS_PROFILE': 'test-profile'}):
-            with patch(
-                'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-            ) as mock_session:
+            with patch('awslabs.cloudwatch_mcp_server.common.boto3.Session') as mock_session:
                 mock_client = Mock()
                 mock_session.return_value.client.return_value = mock_client
 
@@ -332,25 +315,21 @@ class TestEdgeCases:
                 tools._get_logs_client('us-east-1')
 
                 # Verify session was created with profile
-                mock_session.assert_called_with(
-                    profile_name='test-profile', region_name='us-east-1'
-                )
+                mock_session.assert_called_with(profile_name='test-profile')
 
     @pytest.mark.asyncio
     async def test_boto3_client_error_handling(self, mock_context):
         """Test error handling when boto3 client creation fails."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
-            mock_session.side_effect = Exception('AWS credentials not found')
-
+        with patch.object(
+            BotoClientCache, 'get', side_effect=Exception('AWS credentials not found')
+        ):
             tools = CloudWatchLogsTools()
             with pytest.raises(Exception, match='AWS credentials not found'):
                 await tools.describe_log_groups(mock_context)
 
     def test_tools_registration(self):
         """Test that all tools are properly registered."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchLogsTools()
 
             mock_mcp = Mock()
@@ -371,7 +350,7 @@ class TestEdgeCases:
 
     def test_build_logs_query_params_with_none_values(self):
         """Test building query params with None values."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchLogsTools()
 
             params = tools._build_logs_query_params(
@@ -393,9 +372,7 @@ class TestRegionHandling:
 
     def test_get_logs_client_region_parameter(self):
         """Test that _get_logs_client creates client with correct region."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch('awslabs.cloudwatch_mcp_server.common.boto3.Session') as mock_session:
             mock_client = Mock()
             mock_session.return_value.client.return_value = mock_client
 
@@ -403,18 +380,15 @@ class TestRegionHandling:
             result = tools._get_logs_client('ap-northeast-1')
 
             # Verify session was created with correct region
-            mock_session.assert_called_with(region_name='ap-northeast-1')
             mock_session.return_value.client.assert_called_with(
-                'logs', config=mock_session.return_value.client.call_args[1]['config']
+                'logs', region_name='ap-northeast-1', config=BOTO_CLIENT_CONFIG
             )
             assert result == mock_client
 
     def test_get_logs_client_with_aws_profile(self):
         """Test _get_logs_client with AWS_PROFILE environment variable."""
         with patch.dict('os.environ', {'AWS_PROFILE': 'test-profile'}):
-            with patch(
-                'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-            ) as mock_session:
+            with patch('awslabs.cloudwatch_mcp_server.common.boto3.Session') as mock_session:
                 mock_client = Mock()
                 mock_session.return_value.client.return_value = mock_client
 
@@ -422,17 +396,43 @@ class TestRegionHandling:
                 result = tools._get_logs_client('ca-central-1')
 
                 # Verify session was created with profile and region
-                mock_session.assert_called_with(
-                    profile_name='test-profile', region_name='ca-central-1'
+                mock_session.assert_called_with(profile_name='test-profile')
+                mock_session.return_value.client.assert_called_with(
+                    'logs', region_name='ca-central-1', config=BOTO_CLIENT_CONFIG
                 )
                 assert result == mock_client
 
+    def test_get_logs_client_is_cached_per_region(self):
+        """Test that _get_logs_client reuses clients for the same region."""
+        with patch('awslabs.cloudwatch_mcp_server.common.boto3.Session') as mock_session:
+            tools = CloudWatchLogsTools()
+
+            first = tools._get_logs_client('us-west-2')
+            second = tools._get_logs_client('us-west-2')
+            assert first is second
+            assert mock_session.return_value.client.call_count == 1
+
+            tools._get_logs_client('eu-west-1')
+            assert mock_session.return_value.client.call_count == 2
+            # Credentials are resolved by a single session shared across regions
+            assert mock_session.call_count == 1
+
+    def test_close_releases_cached_clients(self):
+        """Test that close closes cached clients and empties the cache."""
+        with patch('awslabs.cloudwatch_mcp_server.common.boto3.Session') as mock_session:
+            tools = CloudWatchLogsTools()
+            tools._get_logs_client('us-west-2')
+
+            tools.close()
+
+            mock_session.return_value.client.return_value.close.assert_called_once()
+            tools._get_logs_client('us-west-2')
+            assert mock_session.return_value.client.call_count == 2
+
     @pytest.mark.asyncio
     async def test_execute_log_insights_query_region_parameter(self, mock_context):
         """Test that execute_log_insights_query uses correct region for client creation."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.start_query.return_value = {'queryId': 'test-query-id'}
             mock_client.get_query_results.return_value = {
@@ -440,7 +440,7 @@ class TestRegionHandling:
                 'results': [],
                 'statistics': {},
             }
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchLogsTools()
 
@@ -464,16 +464,14 @@ class TestRegionHandling:
     @pytest.mark.asyncio
     async def test_get_logs_insight_query_results_region_parameter(self, mock_context):
         """Test that get_logs_insight_query_results uses correct region for client creation."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.get_query_results.return_value = {
                 'status': 'Complete',
                 'results': [],
                 'statistics': {},
             }
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchLogsTools()
 
@@ -491,12 +489,10 @@ class TestRegionHandling:
     @pytest.mark.asyncio
     async def test_cancel_logs_insight_query_region_parameter(self, mock_context):
         """Test that cancel_logs_insight_query uses correct region for client creation."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.stop_query.return_value = {'success': True}
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchLogsTools()
 
@@ -514,15 +510,13 @@ class TestRegionHandling:
     @pytest.mark.asyncio
     async def test_describe_log_groups_region_parameter(self, mock_context):
         """Test that describe_log_groups uses correct region for client creation."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_paginator = Mock()
             mock_paginator.paginate.return_value = [{'logGroups': []}]
             mock_client.get_paginator.return_value = mock_paginator
             mock_client.describe_query_definitions.return_value = {'queryDefinitions': []}
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchLogsTools()
 
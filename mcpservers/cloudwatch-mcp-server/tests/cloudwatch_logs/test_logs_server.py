@@ -22,6 +22,7 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_logs.models import (
     LogsQueryCancelResult,
 )
 from awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools import CloudWatchLogsTools
+from awslabs.cloudwatch_mcp_server.common import BotoClientCache
 from moto import mock_aws
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -58,10 +59,8 @@ async def logs_client():
 @pytest_asyncio.fixture
 async def cloudwatch_tools(logs_client):
     """Create CloudWatchLogsTools instance with mocked client."""
-    with patch(
-        'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.boto3.Session'
-    ) as mock_session:
-        mock_session.return_value.client.return_value = logs_client
+    with patch.object(BotoClientCache, 'get') as mock_get_client:
+        mock_get_client.return_value = logs_client
         tools = CloudWatchLogsTools()
         yield tools
 
@@ -170,6 +169,34 @@ class TestDescribeLogGroups:
         assert len(result.log_group_metadata) == 1
         assert len(result.saved_queries) == 1
 
+    async def test_repeated_describe_is_cached(self, ctx, cloudwatch_tools):
+        """Test that identical calls within the TTL reuse the previous result."""
+        cloudwatch_tools.logs_client.create_log_group(logGroupName='/aws/test/group1')
+        cloudwatch_tools.logs_client.describe_query_definitions = MagicMock(
+            return_value={'queryDefinitions': []}
+        )
+
+        first = await cloudwatch_tools.describe_log_groups(ctx, log_group_name_prefix='/aws')
+        cloudwatch_tools.logs_client.create_log_group(logGroupName='/aws/test/group2')
+        second = await cloudwatch_tools.describe_log_groups(ctx, log_group_name_prefix='/aws')
+
+        assert second is first
+        assert cloudwatch_tools.logs_client.describe_query_definitions.call_count == 1
+
+        # A different filter is not served from the cache
+        other = await cloudwatch_tools.describe_log_groups(ctx, log_group_name_prefix='/aws/test')
+        assert len(other.log_group_metadata) == 2
+
+        # Expired entries are fetched again
+        with patch(
+            'awslabs.cloudwatch_mcp_server.cloudwatch_logs.tools.DESCRIBE_LOG_GROUPS_CACHE_TTL_SECONDS',
+            0,
+        ):
+            refreshed = await cloudwatch_tools.describe_log_groups(
+                ctx, log_group_name_prefix='/aws'
+            )
+        assert len(refreshed.log_group_metadata) == 2
+
     async def test_exception_handling(self, ctx, cloudwatch_tools):
         """Test exception handling in describe_log_groups."""
         # Mock an exception in the logs client
@@ -23,6 +23,7 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     GetMetricDataResponse,
 )
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools import CloudWatchMetricsTools
+from awslabs.cloudwatch_mcp_server.common import BOTO_CLIENT_CONFIG, BotoClientCache
 from datetime import datetime
 from unittest.mock import AsyncMock, Mock, mock_open, patch
 
@@ -42,7 +43,7 @@ class TestMetadataLoadingErrors:
 
     def test_metadata_file_not_found(self):
         """Test handling when metadata file doesn't exist - covers lines 82-83."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             with patch('pathlib.Path.exists', return_value=False):
                 with patch(
                     'awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.logger'
@@ -55,7 +56,7 @@ class TestMetadataLoadingErrors:
 
     def test_metadata_file_read_error(self):
         """Test handling when metadata file can't be read - covers lines 101, 109-111."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             with patch('pathlib.Path.exists', return_value=True):
                 with patch('builtins.open', side_effect=IOError('File read error')):
                     with patch(
@@ -69,7 +70,7 @@ class TestMetadataLoadingErrors:
 
     def test_metadata_json_parse_error(self):
         """Test handling when metadata JSON is invalid - covers lines 101, 109-111."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             with patch('pathlib.Path.exists', return_value=True):
                 with patch('builtins.open', mock_open(read_data='invalid json')):
                     with patch(
@@ -83,7 +84,7 @@ class TestMetadataLoadingErrors:
 
     def test_metadata_entry_processing_error(self):
         """Test handling when individual metadata entries are malformed - covers lines 52, 59-61, 116-118."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             with patch('pathlib.Path.exists', return_value=True):
                 # Mock metadata with malformed entries
                 malformed_metadata = [
@@ -112,7 +113,7 @@ class TestMetadataLoadingErrors:
 
     def test_metadata_entry_key_error(self):
         """Test handling when metadata entry access causes KeyError."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             with patch('pathlib.Path.exists', return_value=True):
                 # Mock metadata that will cause KeyError when accessing
                 metadata_with_error = [
@@ -139,7 +140,7 @@ class TestParameterValidation:
     @pytest.mark.asyncio
     async def test_get_metric_data_group_by_dimension_not_in_schema(self, mock_context):
         """Test error when group_by_dimension is not in schema_dimension_keys."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             with pytest.raises(ValueError) as exc_info:
@@ -162,7 +163,7 @@ class TestParameterValidation:
     @pytest.mark.asyncio
     async def test_get_metric_data_sort_order_without_order_by_statistic(self, mock_context):
         """Test error when sort_order is specified without order_by_statistic."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             with pytest.raises(ValueError) as exc_info:
@@ -184,7 +185,7 @@ class TestParameterValidation:
 
     def test_invalid_metrics_insights_statistic(self):
         """Test validation of invalid Metrics Insights statistic."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             with pytest.raises(ValueError) as exc_info:
@@ -194,7 +195,7 @@ class TestParameterValidation:
 
     def test_map_to_metrics_insights_statistic_invalid(self):
         """Test mapping invalid statistic for Metrics Insights."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             with pytest.raises(ValueError):
@@ -207,12 +208,10 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_get_metric_data_api_error(self, mock_context):
         """Test get_metric_data with API error - covers line 370."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'
-        ) as mock_session:
+        with patch.object(BotoClientCache, 'get') as mock_get_client:
             mock_client = Mock()
             mock_client.get_metric_data.side_effect = Exception('API Error')
-            mock_session.return_value.client.return_value = mock_client
+            mock_get_client.return_value = mock_client
 
             tools = CloudWatchMetricsTools()
 
@@ -232,7 +231,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_get_metric_metadata_api_error(self, mock_context):
         """Test get_metric_metadata with general error - covers lines 537, 566."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Mock _lookup_metadata to raise exception
@@ -250,7 +249,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_get_recommended_metric_alarms_api_error(self, mock_context):
         """Test get_recommended_metric_alarms with general error - covers lines 636-639."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Mock _lookup_metadata to raise exception
@@ -271,7 +270,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_get_recommended_metric_alarms_parse_error(self, mock_context):
         """Test get_recommended_metric_alarms with parse error - covers lines 715-717."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Mock metadata with malformed alarm recommendations
@@ -314,7 +313,7 @@ class TestErrorHandling:
     @pytest.mark.asyncio
     async def test_parse_alarm_recommendation_missing_fields(self, mock_context):
         """Test _parse_alarm_recommendation with missing fields - covers lines 724-727, 745, 751, 755, 757, 761."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Test with minimal alarm data
@@ -338,7 +337,7 @@ class TestErrorHandling:
 
     def test_alarm_matches_dimensions_edge_cases(self):
         """Test _alarm_matches_dimensions edge cases."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Test with empty alarm dimensions - should match any provided dimensions
@@ -380,11 +379,9 @@ class TestEdgeCases:
     @pytest.mark.asyncio
     async def test_boto3_client_error_handling(self, mock_context):
         """Test error handling when boto3 client creation fails."""
-        with patch(
-            'awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'
-        ) as mock_session:
-            mock_session.side_effect = Exception('AWS credentials not found')
-
+        with patch.object(
+            BotoClientCache, 'get', side_effect=Exception('AWS credentials not found')
+        ):
             tools = CloudWatchMetricsTools()
             with pytest.raises(Exception):
                 await tools.get_metric_data(
@@ -397,9 +394,7 @@ class TestEdgeCases:
     def test_default_region_usage(self):
         """Test that default region is used when not specified."""
         with patch.dict('os.environ', {}, clear=True):
-            with patch(
-                'awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'
-            ) as mock_session:
+            with patch('awslabs.cloudwatch_mcp_server.common.boto3.Session') as mock_session:
                 mock_client = Mock()
                 mock_session.return_value.client.return_value = mock_client
 
@@ -408,11 +403,13 @@ class TestEdgeCases:
                 tools._get_cloudwatch_client('us-east-1')
 
                 # Should use default us-east-1
-                mock_session.assert_called_with(region_name='us-east-1')
+                mock_session.return_value.client.assert_called_with(
+                    'cloudwatch', region_name='us-east-1', config=BOTO_CLIENT_CONFIG
+                )
 
     def test_tools_registration(self):
         """Test that all tools are properly registered."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             mock_mcp = Mock()
@@ -431,7 +428,7 @@ class TestEdgeCases:
 
     def test_process_metric_data_response_edge_cases(self):
         """Test _process_metric_data_response with edge cases."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Test with empty response
@@ -460,7 +457,7 @@ class TestEdgeCases:
 
     def test_build_where_clause_edge_cases(self):
         """Test _build_where_clause with edge cases."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Test with empty dimensions
@@ -482,7 +479,7 @@ class TestEdgeCases:
 
     def test_build_schema_string_edge_cases(self):
         """Test _build_schema_string with edge cases."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Test with no dimension keys
@@ -499,7 +496,7 @@ class TestEdgeCases:
 
     def test_statistic_mappings(self):
         """Test statistic mapping functions."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Test CloudWatch statistic mapping
@@ -520,7 +517,7 @@ class TestEdgeCases:
 
     def test_period_calculation_edge_cases(self):
         """Test period calculation with edge cases."""
-        with patch('awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'):
+        with patch.object(BotoClientCache, 'get'):
             tools = CloudWatchMetricsTools()
 
             # Test with very short time window
@@ -21,6 +21,7 @@ from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.models import (
     GetMetricDataResponse,
 )
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools import CloudWatchMetricsTools
+from awslabs.cloudwatch_mcp_server.common import BotoClientCache
 from datetime import datetime
 from moto import mock_aws
 from typing import Any
@@ -53,10 +54,8 @@ async def cloudwatch_client(aws_credentials):
 @pytest_asyncio.fixture
 async def cloudwatch_metrics_tools(cloudwatch_client):
     """Create CloudWatchMetricsTools instance with mocked client."""
-    with patch(
-        'awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'
-    ) as mock_session:
-        mock_session.return_value.client.return_value = cloudwatch_client
+    with patch.object(BotoClientCache, 'get') as mock_get_client:
+        mock_get_client.return_value = cloudwatch_client
         tools = CloudWatchMetricsTools()
         yield tools
 
@@ -116,6 +115,7 @@ class TestGetMetricData:
             assert call_args['MetricDataQueries'][0]['MetricStat']['Stat'] == 'Average'
             assert call_args['StartTime'] == start_time
             assert call_args['EndTime'] == end_time
+            assert call_args['ScanBy'] == 'TimestampAscending'
             assert isinstance(result, GetMetricDataResponse)
             assert len(result.metricDataResults) == 1
             assert result.metricDataResults[0].label == 'CPUUtilization'
@@ -16,6 +16,7 @@
 import pytest
 import pytest_asyncio
 from awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools import CloudWatchMetricsTools
+from awslabs.cloudwatch_mcp_server.common import BotoClientCache
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
@@ -28,10 +29,8 @@ async def ctx():
 @pytest_asyncio.fixture
 async def cloudwatch_metrics_tools():
     """Create CloudWatchMetricsTools instance with mocked client."""
-    with patch(
-        'awslabs.cloudwatch_mcp_server.cloudwatch_metrics.tools.boto3.Session'
-    ) as mock_session:
-        mock_session.return_value.client.return_value = MagicMock()
+    with patch.object(BotoClientCache, 'get') as mock_get_client:
+        mock_get_client.return_value = MagicMock()
         tools = CloudWatchMetricsTools()
         return tools
 
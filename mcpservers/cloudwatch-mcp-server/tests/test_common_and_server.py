@@ -23,9 +23,10 @@ from awslabs.cloudwatch_mcp_server.common import (
     clean_up_pattern,
     epoch_ms_to_utc_iso,
     filter_by_prefixes,
+    parse_iso8601,
     remove_null_values,
 )
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 
 class TestCommonUtilities:
@@ -71,6 +72,15 @@ class TestCommonUtilities:
         assert result.startswith('2021-01-01T00:00:00')
         assert result.endswith('+00:00')
 
+    def test_parse_iso8601(self):
+        """Test parsing ISO 8601 strings with and without a Z suffix."""
+        zulu = parse_iso8601('2021-01-01T00:00:00Z')
+        offset = parse_iso8601('2021-01-01T00:00:00+00:00')
+
+        assert zulu == offset
+        assert zulu.utcoffset() is not None
+        assert parse_iso8601('2021-01-01T00:00:00').tzinfo is None
+
     def test_clean_up_pattern_with_logsamples(self):
         """Test clean_up_pattern function with @logSamples - covers line 37 in common.py."""
         pattern_result = [
@@ -213,33 +223,24 @@ class TestServerInitialization:
 
     def test_server_main_function(self):
         """Test server main function."""
-        with patch('awslabs.cloudwatch_mcp_server.server.mcp') as mock_mcp:
-            with patch('awslabs.cloudwatch_mcp_server.server.logger') as mock_logger:
-                from awslabs.cloudwatch_mcp_server.server import main
+        with (
+            patch('awslabs.cloudwatch_mcp_server.server.mcp') as mock_mcp,
+            patch('awslabs.cloudwatch_mcp_server.server.anyio') as mock_anyio,
+            patch('awslabs.cloudwatch_mcp_server.server.logger') as mock_logger,
+        ):
+            from awslabs.cloudwatch_mcp_server.server import main
 
-                main()
+            main()
 
-                # Should call mcp.run()
-                mock_mcp.run.assert_called_once()
-                mock_logger.info.assert_called_with('CloudWatch MCP server started')
+            # Should run the streamable HTTP server through anyio
+            mock_anyio.run.assert_called_once()
+            assert mock_anyio.run.call_args[0] == (mock_mcp.run_streamable_http_async,)
+            mock_logger.info.assert_called_with('CloudWatch MCP server started')
 
 
 class TestEdgeCasesCoverage:
     """Test additional edge cases to ensure complete coverage."""
 
-    def test_epoch_ms_to_utc_iso_with_z_suffix(self):
-        """Test epoch_ms_to_utc_iso when isoformat returns Z suffix."""
-        # Mock the datetime module in the common module
-        with patch('awslabs.cloudwatch_mcp_server.common.datetime') as mock_datetime:
-            mock_dt = Mock()
-            mock_dt.isoformat.return_value = '2021-01-01T00:00:00Z'
-            mock_datetime.datetime.fromtimestamp.return_value = mock_dt
-
-            result = epoch_ms_to_utc_iso(1609459200000)
-
-            # Should convert Z to +00:00
-            assert result == '2021-01-01T00:00:00+00:00'
-
     def test_filter_by_prefixes_empty_sets(self):
         """Test filter_by_prefixes with empty sets."""
         # Empty strings set
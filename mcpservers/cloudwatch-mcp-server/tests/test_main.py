@@ -13,23 +13,43 @@
 # limitations under the License.
 """Tests for the main function in server.py."""
 
+import sys
+from awslabs.cloudwatch_mcp_server import server
 from awslabs.cloudwatch_mcp_server.server import main
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 
 class TestMain:
     """Tests for the main function."""
 
-    @patch('awslabs.cloudwatch_mcp_server.server.mcp.run')
+    @patch('awslabs.cloudwatch_mcp_server.server.anyio.run')
     @patch('sys.argv', ['awslabs.cloudwatch-mcp-server'])
     def test_main_default(self, mock_run):
         """Test main function with default arguments."""
         # Call the main function
         main()
 
-        # Check that mcp.run was called with the correct arguments
+        # Check that the streamable HTTP server was started through anyio
         mock_run.assert_called_once()
-        assert mock_run.call_args[1].get('transport') is None
+        assert mock_run.call_args[0] == (server.mcp.run_streamable_http_async,)
+
+    @patch('awslabs.cloudwatch_mcp_server.server.anyio.run')
+    @patch('awslabs.cloudwatch_mcp_server.server.logger')
+    def test_main_configures_log_sink(self, mock_logger, mock_run, monkeypatch):
+        """Test that main, not the module import, replaces the loguru sinks."""
+        monkeypatch.delenv('FASTMCP_LOG_LEVEL', raising=False)
+        main()
+
+        mock_logger.remove.assert_called_once_with()
+        mock_logger.add.assert_called_once_with(sys.stderr, level='WARNING')
+
+    def test_anyio_backend_options(self, monkeypatch):
+        """Test that uvloop is selected only when it is importable."""
+        monkeypatch.setitem(sys.modules, 'uvloop', None)
+        assert server._anyio_backend_options() == {}
+
+        monkeypatch.setitem(sys.modules, 'uvloop', MagicMock())
+        assert server._anyio_backend_options() == {'use_uvloop': True}
 
     def test_module_execution(self):
         """Test the module execution when run as __main__."""
@@ -20,7 +20,7 @@ from loguru import logger
 
 
 class DBConnectionSingleton:
-    """Manages a single RDS Data API connection instance across the application."""
+    """Manages the single database connection instance used across the application."""
 
     _instance = None
 
@@ -88,6 +88,20 @@ class DBConnectionSingleton:
                 is_test=is_test,
             )
 
+    @classmethod
+    def set_connection(cls, db_connection):
+        """Install an already created connection as the singleton's connection.
+
+        Used for connections that are not built from RDS Data API parameters, such as the
+        psycopg connection pool. Replaces any connection installed earlier.
+
+        Args:
+            db_connection: The database connection to share across the application
+        """
+        instance = cls.__new__(cls)
+        instance._db_connection = db_connection
+        cls._instance = instance
+
     @classmethod
     def get(cls):
         """Get the singleton instance."""
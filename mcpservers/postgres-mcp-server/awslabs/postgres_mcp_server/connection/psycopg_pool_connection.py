@@ -4,12 +4,97 @@
 # 2. Properly manage async pool lifecycle
 # 3. Use lazy initialization
 
+import asyncio
 import boto3
 import json
+import re
+import time
 from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
+from botocore.config import Config
+from functools import lru_cache
 from loguru import logger
+from psycopg.conninfo import make_conninfo
 from psycopg_pool import AsyncConnectionPool
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+
+# Credentials fetched from Secrets Manager are reused for this many seconds, keyed by
+# (secret_arn, region), so new connection objects skip the API round trip
+SECRET_CACHE_TTL_SECONDS = 300
+
+_secret_cache: Dict[Tuple[str, str], Tuple[float, Tuple[str, str]]] = {}
+
+# Fail fast on the start-up credential lookup instead of waiting through the default retries
+# and 60 second read timeout
+SECRETS_MANAGER_CLIENT_CONFIG = Config(
+    retries={'total_max_attempts': 2, 'mode': 'standard'},
+    connect_timeout=2,
+    read_timeout=5,
+    tcp_keepalive=True,
+)
+
+
+@lru_cache(maxsize=None)
+def _secrets_manager_client(region: str):
+    """Return a Secrets Manager client for the region, created once per process."""
+    return boto3.Session().client(
+        service_name='secretsmanager', region_name=region, config=SECRETS_MANAGER_CLIENT_CONFIG
+    )
+
+
+# Each pooled connection prepares a statement server side once it has run this many times and
+# keeps up to PREPARED_STATEMENT_CACHE_SIZE of them, least recently used evicted first. The
+# diagnostic tools send the same SQL text on every call, so they stop being re-parsed and
+# re-planned after their first few runs on a connection
+PREPARE_THRESHOLD = 2
+PREPARED_STATEMENT_CACHE_SIZE = 256
+
+# Startup option for readonly pools: the server applies it to every session when the
+# connection is opened, so each connection is read-only without an extra round trip
+READONLY_CONNECTION_OPTIONS = '-c default_transaction_read_only=on'
+
+# Matches RDS Data API style :name placeholders, skipping PostgreSQL ::type casts
+_NAMED_PARAM_RE = re.compile(r'(?<!:):([A-Za-z_][A-Za-z0-9_]*)\b')
+
+# RDS Data API cell key for each Python type psycopg returns natively
+_CELL_VALUE_KEYS = {
+    str: 'stringValue',
+    int: 'longValue',
+    float: 'doubleValue',
+    bytes: 'blobValue',
+}
+
+# Constant cells shared by every record instead of allocating a new dict per cell. They are
+# read-only views, so a caller that tries to modify a cell cannot corrupt later results
+_NULL_CELL: Mapping[str, Any] = MappingProxyType({'isNull': True})
+_TRUE_CELL: Mapping[str, Any] = MappingProxyType({'booleanValue': True})
+_FALSE_CELL: Mapping[str, Any] = MappingProxyType({'booleanValue': False})
+
+
+def _to_cell(value: Any) -> Mapping[str, Any]:
+    """Convert a result value to an RDS Data API style cell with a single type lookup."""
+    if value is None:
+        return _NULL_CELL
+    if value is True:
+        return _TRUE_CELL
+    if value is False:
+        return _FALSE_CELL
+    key = _CELL_VALUE_KEYS.get(type(value))
+    if key is None:
+        # Subclasses such as IntEnum miss the exact type lookup but keep their base type's key
+        key = next((k for t, k in _CELL_VALUE_KEYS.items() if isinstance(value, t)), None)
+    if key is not None:
+        return {key: value}
+    # Convert other types to string
+    return {'stringValue': str(value)}
+
+
+def _cell_row(cursor):
+    """Row factory building each result row directly as a list of RDS Data API cells."""
+    # Rows are converted as psycopg produces them, so there is no fetchall() list of default
+    # tuple rows followed by a second Python loop converting each one
+    return lambda values: list(map(_to_cell, values))
 
 
 class PsycopgPoolConnection(AbstractDBConnection):
@@ -35,49 +120,83 @@ class PsycopgPoolConnection(AbstractDBConnection):
         self.min_size = min_size
         self.max_size = max_size
         self.pool: Optional['AsyncConnectionPool[Any]'] = None
-        self._pool_initialized = False
+        self._init_lock = asyncio.Lock()
 
-        # Get credentials from Secrets Manager
-        logger.info(f'Retrieving credentials from Secrets Manager: {secret_arn}')
-        self.user, self.password = self._get_credentials_from_secret(secret_arn, region, is_test)
-        logger.info(f'Successfully retrieved credentials for user: {self.user}')
-
-        # Store connection info
-        if not is_test:
-            self.conninfo = f'host={host} port={port} dbname={database} user={self.user} password={self.password}'
-            logger.info('Connection parameters stored')
+        # Credentials are resolved in initialize_pool so the constructor never blocks on
+        # Secrets Manager
+        self.secret_arn = secret_arn
+        self.region = region
+        self.is_test = is_test
 
     async def initialize_pool(self):
-        """Initialize the connection pool - FIXED VERSION."""
-        if self.pool is None and not self._pool_initialized:
+        """Initialize the connection pool once, even when called concurrently."""
+        if self.pool is not None:
+            return
+
+        async with self._init_lock:
+            # Another caller may have finished initialization while we waited for the lock
+            if self.pool is not None:
+                return
+
+            # boto3 is synchronous, so fetch the credentials off the event loop
+            logger.info(f'Retrieving credentials from Secrets Manager: {self.secret_arn}')
+            self.user, password = await asyncio.to_thread(
+                self._get_credentials_from_secret, self.secret_arn, self.region, self.is_test
+            )
+            logger.info(f'Successfully retrieved credentials for user: {self.user}')
+
+            # make_conninfo quotes values, so passwords containing spaces, quotes or '=' work.
+            # TCP keepalives let the pool notice dropped connections to the database.
+            options = {'options': READONLY_CONNECTION_OPTIONS} if self.readonly_query else {}
+            self.conninfo = make_conninfo(
+                host=self.host,
+                port=self.port,
+                dbname=self.database,
+                user=self.user,
+                password=password,
+                keepalives=1,
+                keepalives_idle=30,
+                **options,
+            )
+
             logger.info(
                 f'Initializing connection pool with min_size={self.min_size}, max_size={self.max_size}'
             )
-            
-            # ✅ FIX: Create pool with open=False, then open it properly in async context
-            self.pool = AsyncConnectionPool(
-                self.conninfo, 
-                min_size=self.min_size, 
-                max_size=self.max_size, 
-                open=False  # ✅ KEY FIX: Don't open in constructor
+
+            # Create the pool with open=False and open it here in the async context
+            pool = AsyncConnectionPool(
+                self.conninfo,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                configure=self._configure_connection,
+                open=False,
             )
-            
-            # ✅ FIX: Open the pool in proper async context
-            await self.pool.open()
-            self._pool_initialized = True
-            
+            # Wait until min_size connections are established, so the first queries find warm
+            # connections instead of paying connect and authentication. On timeout the pool
+            # closes itself and raises PoolTimeout
+            await pool.open(wait=True, timeout=15.0)
+
+            # Only publish the pool once it is open so the fast path above never sees a
+            # half-initialized pool
+            self.pool = pool
             logger.info('Connection pool initialized successfully')
 
-            # Set read-only mode if needed
-            if self.readonly_query:
-                await self._set_all_connections_readonly()
-
-    async def _get_connection(self):
-        """Get a database connection from the pool - FIXED VERSION."""
-        # ✅ FIX: Always ensure pool is initialized before use
-        if not self._pool_initialized:
-            await self.initialize_pool()
-
+    async def _configure_connection(self, conn) -> None:
+        """Apply per-connection settings once, when the pool opens a new connection."""
+        conn.prepare_threshold = PREPARE_THRESHOLD
+        conn.prepared_max = PREPARED_STATEMENT_CACHE_SIZE
+
+        if self.readonly_query:
+            # psycopg then opens every transaction with BEGIN READ ONLY, so no separate
+            # SET TRANSACTION READ ONLY statement is needed per query. The session default set
+            # by READONLY_CONNECTION_OPTIONS still covers statements outside that transaction
+            await conn.set_read_only(True)
+        else:
+            # Write-mode statements run without an explicit BEGIN/COMMIT wrapper
+            await conn.set_autocommit(True)
+
+    def _get_connection(self):
+        """Get a database connection context manager from the initialized pool."""
         if self.pool is None:
             raise ValueError('Failed to initialize connection pool')
 
@@ -88,83 +207,60 @@ class PsycopgPoolConnection(AbstractDBConnection):
     ) -> Dict[str, Any]:
         """Execute a SQL query using async connection - FIXED VERSION."""
         try:
-            # ✅ FIX: Ensure pool is ready before executing queries
-            if not self._pool_initialized:
+            # Ensure pool is ready before executing queries
+            if self.pool is None:
                 await self.initialize_pool()
                 
-            async with await self._get_connection() as conn:
-                async with conn.transaction():
-                    if self.readonly_query:
-                        await conn.execute('SET TRANSACTION READ ONLY')
-
-                    # Create a cursor for better control
-                    async with conn.cursor() as cursor:
-                        # Execute the query
-                        if parameters:
-                            params = self._convert_parameters(parameters)
-                            # ✅ FIX: Convert RDS Data API parameter syntax to psycopg syntax
-                            converted_sql, converted_params = self._convert_named_parameters_to_psycopg(sql, params)
-                            await cursor.execute(converted_sql, converted_params)
-                        else:
-                            await cursor.execute(sql)
-
-                        # Check if there are results to fetch
-                        if cursor.description:
-                            # Get column names
-                            columns = [desc[0] for desc in cursor.description]
-
-                            # Fetch all rows
-                            rows = await cursor.fetchall()
-
-                            # Structure the response
-                            column_metadata = [{'name': col} for col in columns]
-                            records = []
-
-                            # Convert each row to the expected format
-                            for row in rows:
-                                record = []
-                                for value in row:
-                                    if value is None:
-                                        record.append({'isNull': True})
-                                    elif isinstance(value, str):
-                                        record.append({'stringValue': value})
-                                    elif isinstance(value, int):
-                                        record.append({'longValue': value})
-                                    elif isinstance(value, float):
-                                        record.append({'doubleValue': value})
-                                    elif isinstance(value, bool):
-                                        record.append({'booleanValue': value})
-                                    elif isinstance(value, bytes):
-                                        record.append({'blobValue': value})
-                                    else:
-                                        # Convert other types to string
-                                        record.append({'stringValue': str(value)})
-                                records.append(record)
-
-                            return {'columnMetadata': column_metadata, 'records': records}
-                        else:
-                            # No results (e.g., for INSERT, UPDATE, etc.)
-                            return {'columnMetadata': [], 'records': []}
-
-        except Exception as e:
-            logger.error(f'Database connection error: {str(e)}')
-            raise e
-
-    async def _set_all_connections_readonly(self):
-        """Set all connections in the pool to read-only mode."""
-        if self.pool is None:
-            logger.warning('Connection pool is not initialized, cannot set read-only mode')
-            return
+            async with self._get_connection() as conn, conn.cursor(
+                row_factory=_cell_row
+            ) as cursor:
+                if self.readonly_query:
+                    # Read-only queries keep their BEGIN READ ONLY transaction. Pipeline mode sends
+                    # BEGIN and the query back to back, so they cost a single server round trip
+                    async with conn.pipeline() as pipeline, conn.transaction():
+                        await self._execute_statement(cursor, sql, parameters)
+
+                        # Receive the pipelined results before inspecting the cursor
+                        await pipeline.sync()
+                else:
+                    # Write-mode connections run in autocommit, so the statement is its own
+                    # implicit transaction without separate BEGIN and COMMIT round trips
+                    await self._execute_statement(cursor, sql, parameters)
+
+                # Check if there are results to fetch
+                if cursor.description:
+                    # Get column names
+                    columns = [desc[0] for desc in cursor.description]
+
+                    # Structure the response; the row factory has already shaped each row as
+                    # it was loaded, so rows are collected as the cursor yields them
+                    column_metadata = [{'name': col} for col in columns]
+                    records = [row async for row in cursor]
+
+                    return {'columnMetadata': column_metadata, 'records': records}
+
+                # No results (e.g., for INSERT, UPDATE, etc.)
+                return {'columnMetadata': [], 'records': []}
 
-        try:
-            async with self.pool.connection(timeout=15.0) as conn:
-                await conn.execute(
-                    'ALTER ROLE CURRENT_USER SET default_transaction_read_only = on'
-                )
-                logger.info('Successfully set connection to read-only mode')
         except Exception as e:
-            logger.warning(f'Failed to set connections to read-only mode: {str(e)}')
-            logger.warning('Continuing without setting read-only mode')
+            logger.error('Database connection error: {}', e)
+            raise
+
+    async def _execute_statement(
+        self, cursor, sql: str, parameters: Optional[List[Dict[str, Any]]]
+    ) -> None:
+        """Execute a statement on the cursor, converting RDS Data API style parameters."""
+        if parameters:
+            params = self._convert_parameters(parameters)
+            # Convert RDS Data API parameter syntax to psycopg syntax
+            converted_sql, converted_params = self._convert_named_parameters_to_psycopg(
+                sql, params
+            )
+            # Parameterized statements are reused templates, so prepare them server side and
+            # skip re-parsing and re-planning on later calls
+            await cursor.execute(converted_sql, converted_params, prepare=True)
+        else:
+            await cursor.execute(sql)
 
     def _convert_parameters(self, parameters: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Transform structured parameter format to psycopg's native parameter format."""
@@ -196,16 +292,11 @@ class PsycopgPoolConnection(AbstractDBConnection):
         RDS Data API uses: SELECT * FROM table WHERE id = :id
         psycopg uses: SELECT * FROM table WHERE id = %(id)s
         """
-        import re
-        
-        # Convert :param_name to %(param_name)s
-        converted_sql = sql
-        for param_name in parameters.keys():
-            # Replace :param_name with %(param_name)s
-            pattern = f':{param_name}\\b'  # Word boundary to avoid partial matches
-            replacement = f'%({param_name})s'
-            converted_sql = re.sub(pattern, replacement, converted_sql)
-        
+        # Convert every :param_name to %(param_name)s in a single pass
+        converted_sql = _NAMED_PARAM_RE.sub(
+            lambda m: f'%({m.group(1)})s' if m.group(1) in parameters else m.group(0), sql
+        )
+
         return converted_sql, parameters
 
     def _get_credentials_from_secret(
@@ -215,11 +306,15 @@ class PsycopgPoolConnection(AbstractDBConnection):
         if is_test:
             return 'test_user', 'test_password'
 
+        cache_key = (secret_arn, region)
+        cached = _secret_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < SECRET_CACHE_TTL_SECONDS:
+            logger.info(f'Using cached credentials for {secret_arn}')
+            return cached[1]
+
         try:
-            # Create a Secrets Manager client
-            logger.info(f'Creating Secrets Manager client in region {region}')
-            session = boto3.Session()
-            client = session.client(service_name='secretsmanager', region_name=region)
+            # Reuse the Secrets Manager client for this region
+            client = _secrets_manager_client(region)
 
             # Get the secret value
             logger.info(f'Retrieving secret value for {secret_arn}')
@@ -250,6 +345,7 @@ class PsycopgPoolConnection(AbstractDBConnection):
                     )
 
                 logger.info(f'Successfully extracted credentials for user: {username}')
+                _secret_cache[cache_key] = (time.monotonic(), (username, password))
                 return username, password
             else:
                 logger.error('Secret does not contain a SecretString')
@@ -264,14 +360,18 @@ class PsycopgPoolConnection(AbstractDBConnection):
             logger.info('Closing connection pool')
             await self.pool.close()
             self.pool = None
-            self._pool_initialized = False  # ✅ FIX: Reset initialization flag
             logger.info('Connection pool closed successfully')
 
     async def check_connection_health(self) -> bool:
         """Check if the connection is healthy."""
         try:
-            result = await self.execute_query('SELECT 1')
-            return len(result.get('records', [])) > 0
+            if self.pool is None:
+                await self.initialize_pool()
+
+            # Round trip a trivial statement without the result conversion in execute_query
+            async with self._get_connection() as conn:
+                await conn.execute('SELECT 1')
+            return True
         except Exception as e:
             logger.error(f'Connection health check failed: {str(e)}')
             return False
@@ -17,10 +17,21 @@
 import asyncio
 import boto3
 from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
+from botocore.config import Config
 from loguru import logger
 from typing import Any, Dict, List, Optional
 
 
+# Calls run on asyncio.to_thread's default executor, which has up to 32 worker threads. With
+# botocore's default of 10 pooled HTTPS connections, concurrent tool calls such as a diagnostic
+# bundle would open and then discard connections to the Data API endpoint.
+RDS_DATA_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'total_max_attempts': 4, 'mode': 'standard'},
+    tcp_keepalive=True,
+)
+
+
 class RDSDataAPIConnection(AbstractDBConnection):
     """Class that wraps DB connection client by RDS API."""
 
@@ -48,7 +59,9 @@ class RDSDataAPIConnection(AbstractDBConnection):
         self.secret_arn = secret_arn
         self.database = database
         if not is_test:
-            self.data_client = boto3.client('rds-data', region_name=region)
+            self.data_client = boto3.client(
+                'rds-data', region_name=region, config=RDS_DATA_CLIENT_CONFIG
+            )
 
     async def execute_query(
         self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
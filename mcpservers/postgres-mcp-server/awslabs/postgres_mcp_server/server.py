@@ -16,7 +16,9 @@
 
 import argparse
 import asyncio
+import os
 import sys
+import time
 from awslabs.postgres_mcp_server.connection import DBConnectionSingleton
 from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import PsycopgPoolConnection
 from awslabs.postgres_mcp_server.mutable_sql_detector import (
@@ -24,61 +26,52 @@ from awslabs.postgres_mcp_server.mutable_sql_detector import (
     detect_mutating_keywords,
 )
 from botocore.exceptions import BotoCoreError, ClientError
+from dataclasses import dataclass
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
 from starlette.responses import PlainTextResponse
 from starlette.requests import Request
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Coroutine, Dict, Final, List, Optional, Tuple
 
 
-client_error_code_key = 'run_query ClientError code'
-unexpected_error_key = 'run_query unexpected error'
-write_query_prohibited_key = 'Your MCP tool only allows readonly query. If you want to write, change the MCP configuration per README.md'
-query_comment_prohibited_key = 'The comment in query is prohibited because of injection risk'
-query_injection_risk_key = 'Your query contains risky injection patterns'
+client_error_code_key: Final[str] = 'run_query ClientError code'
+unexpected_error_key: Final[str] = 'run_query unexpected error'
+write_query_prohibited_key: Final[str] = 'Your MCP tool only allows readonly query. If you want to write, change the MCP configuration per README.md'
+query_comment_prohibited_key: Final[str] = 'The comment in query is prohibited because of injection risk'
+query_injection_risk_key: Final[str] = 'Your query contains risky injection patterns'
 
+# get_table_schema results are reused for this many seconds, keyed by table name, since table
+# definitions rarely change between the repeated lookups of an agent session
+SCHEMA_CACHE_TTL_SECONDS = 300
+SCHEMA_CACHE_MAX_ENTRIES = 1024
 
-class DummyCtx:
-    """A dummy context class for error handling in MCP tools."""
-
-    async def error(self, message):
-        """Raise a runtime error with the given message.
-
-        Args:
-            message: The error message to include in the runtime error
-        """
-        # Do nothing
-        pass
+_schema_cache: Dict[str, Tuple[float, list[dict]]] = {}
 
 
 def extract_cell(cell: dict):
     """Extracts the scalar or array value from a single cell."""
     if cell.get('isNull'):
         return None
-    for key in (
-        'stringValue',
-        'longValue',
-        'doubleValue',
-        'booleanValue',
-        'blobValue',
-        'arrayValue',
-    ):
-        if key in cell:
-            return cell[key]
+    # A Data API cell carries a single value key next to an optional isNull flag, so the first
+    # non-isNull entry is the value, found without probing every possible key in turn
+    for key, value in cell.items():
+        if key != 'isNull':
+            return value
     return None
 
 
+def _compact_sql(sql: str) -> str:
+    """Collapse the layout whitespace of a fixed query, so fewer bytes are sent per call."""
+    return ' '.join(sql.split())
+
+
 def parse_execute_response(response: dict) -> list[dict]:
     """Convert RDS Data API execute_statement response to list of rows."""
     columns = [col['name'] for col in response.get('columnMetadata', [])]
-    records = []
-
-    for row in response.get('records', []):
-        row_data = {col: extract_cell(cell) for col, cell in zip(columns, row)}
-        records.append(row_data)
 
-    return records
+    # dict(zip(...)) over map() builds each row without a per-cell comprehension frame
+    return [dict(zip(columns, map(extract_cell, row))) for row in response.get('records', [])]
 
 
 mcp = FastMCP(
@@ -88,14 +81,16 @@ mcp = FastMCP(
     ],
 )
 
-# Global variable to store the direct database connection
-_global_db_connection = None
+# Built once and reused: a response without a background task is never modified while it is
+# sent, so every ALB health check can return the same instance
+_HEALTH_RESPONSE = PlainTextResponse('OK')
+
 
 # Add health check endpoint for ALB health checks
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request: Request) -> PlainTextResponse:
     """Health check endpoint for load balancer."""
-    return PlainTextResponse("OK")
+    return _HEALTH_RESPONSE
 
 
 
@@ -120,35 +115,17 @@ async def run_query(
     Returns:
         List of dictionary that contains query response rows
     """
-    global client_error_code_key
-    global unexpected_error_key
-    global write_query_prohibited_key
-
-    if db_connection is None:
-        try:
-            # Try to get the connection from the singleton (for RDS Data API)
-            db_connection = DBConnectionSingleton.get().db_connection
-        except RuntimeError:
-            # If the singleton is not initialized, try the global direct connection
-            global _global_db_connection
-            if _global_db_connection is not None:
-                db_connection = _global_db_connection
-            else:
-                logger.error('No database connection available')
-                await ctx.error('No database connection available')
-                return [{'error': 'No database connection available'}]
-
+    db_connection = await _resolve_db_connection(db_connection, ctx)
     if db_connection is None:
-        raise AssertionError('db_connection should never be None')
+        return [{'error': 'No database connection available'}]
 
-    if db_connection.readonly_query:
-        matches = detect_mutating_keywords(sql)
-        if (bool)(matches):
-            logger.info(
-                f'query is rejected because current setting only allows readonly query. detected keywords: {matches}, SQL query: {sql}'
-            )
-            await ctx.error(write_query_prohibited_key)
-            return [{'error': write_query_prohibited_key}]
+    matches = detect_mutating_keywords(sql)
+    if db_connection.readonly_query and matches:
+        logger.info(
+            f'query is rejected because current setting only allows readonly query. detected keywords: {matches}, SQL query: {sql}'
+        )
+        await ctx.error(write_query_prohibited_key)
+        return [{'error': write_query_prohibited_key}]
 
     issues = check_sql_injection_risk(sql)
     if issues:
@@ -160,13 +137,63 @@ async def run_query(
         )
         return [{'error': query_injection_risk_key}]
 
+    result = await _run_query_unchecked(sql, ctx, db_connection, query_parameters)
+
+    # A successful write may have altered, dropped or created a table, so stop serving the
+    # cached get_table_schema results instead of returning them stale until the TTL expires
+    if matches and not any('error' in row for row in result):
+        _schema_cache.clear()
+
+    return result
+
+
+async def _resolve_db_connection(db_connection, ctx):
+    """Return the connection to query, falling back to the server's configured connection.
+
+    Reports the error through ctx and returns None when no connection is available.
+    """
+    if db_connection is not None:
+        return db_connection
+
     try:
-        logger.info(f'run_query: readonly:{db_connection.readonly_query}, SQL:{sql}')
+        return DBConnectionSingleton.get().db_connection
+    except RuntimeError:
+        logger.error('No database connection available')
+        await ctx.error('No database connection available')
+        return None
+
+
+async def _run_query_unchecked(
+    sql: str,
+    ctx: Context,
+    db_connection=None,
+    query_parameters: Optional[List[Dict[str, Any]]] = None,
+) -> list[dict]:
+    """Run a trusted SQL statement without the readonly keyword and injection checks.
+
+    Only for the fixed SQL of this server's own tools, which binds any user input as a query
+    parameter. Arbitrary SQL must go through run_query.
+
+    Args:
+        sql: The sql statement to run
+        ctx: MCP context for logging and state management
+        db_connection: DB connection object passed by unit test. It should be None if called by MCP server.
+        query_parameters: Parameters for the SQL query
+
+    Returns:
+        List of dictionary that contains query response rows
+    """
+    db_connection = await _resolve_db_connection(db_connection, ctx)
+    if db_connection is None:
+        return [{'error': 'No database connection available'}]
+
+    try:
+        logger.debug('run_query: readonly:{}, SQL:{}', db_connection.readonly_query, sql)
 
         # Execute the query using the abstract connection interface
         response = await db_connection.execute_query(sql, query_parameters)
 
-        logger.success(f'run_query successfully executed query:{sql}')
+        logger.debug('run_query successfully executed query:{}', sql)
         return parse_execute_response(response)
     except ClientError as e:
         logger.exception(client_error_code_key)
@@ -181,9 +208,26 @@ async def run_query(
         return [{'error': unexpected_error_key}]
 
 
+_SQL_GET_TABLE_SCHEMA = _compact_sql("""
+    SELECT
+        a.attname AS column_name,
+        pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
+        col_description(a.attrelid, a.attnum) AS column_comment
+    FROM
+        pg_attribute a
+    WHERE
+        a.attrelid = to_regclass(:table_name)
+        AND a.attnum > 0
+        AND NOT a.attisdropped
+    ORDER BY a.attnum
+""")
+
+
 @mcp.tool(
     name='get_table_schema',
-    description='Fetch table columns and comments from Postgres',
+    description='Fetch table columns and comments from Postgres. Results are cached per table '
+    f'for up to {SCHEMA_CACHE_TTL_SECONDS} seconds, so schema changes made by other clients can '
+    'take that long to appear; a successful write through run_query clears the cache',
 )
 async def get_table_schema(
     table_name: Annotated[str, Field(description='name of the table')], ctx: Context
@@ -197,30 +241,39 @@ async def get_table_schema(
     Returns:
         List of dictionary that contains query response rows
     """
-    logger.info(f'get_table_schema: {table_name}')
-
-    sql = """
-        SELECT
-            a.attname AS column_name,
-            pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
-            col_description(a.attrelid, a.attnum) AS column_comment
-        FROM
-            pg_attribute a
-        WHERE
-            a.attrelid = to_regclass(:table_name)
-            AND a.attnum > 0
-            AND NOT a.attisdropped
-        ORDER BY a.attnum
-    """
+    logger.debug('get_table_schema: {}', table_name)
+
+    cached = _schema_cache.get(table_name)
+    if cached is not None and time.monotonic() - cached[0] < SCHEMA_CACHE_TTL_SECONDS:
+        return cached[1]
 
     params = [{'name': 'table_name', 'value': {'stringValue': table_name}}]
 
-    return await run_query(sql=sql, ctx=ctx, query_parameters=params)
+    result = await _run_query_unchecked(sql=_SQL_GET_TABLE_SCHEMA, ctx=ctx, query_parameters=params)
+
+    # Only cache successful lookups, so a transient error is retried on the next call
+    if not any('error' in row for row in result):
+        if table_name not in _schema_cache and len(_schema_cache) >= SCHEMA_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry; dicts keep insertion order
+            del _schema_cache[next(iter(_schema_cache))]
+        _schema_cache[table_name] = (time.monotonic(), result)
+
+    return result
 
 
 # ===== PostgreSQL Diagnostic Tools =====
 # Based on runbooks.py - PostgreSQL-only tools (CloudWatch tools skipped)
 
+_SQL_PG_STAT_ACTIVITY_SLOW_QUERY_LAST_5MINS = _compact_sql("""
+    SELECT datname, pid, usename, application_name, client_addr, state, 
+    now() - query_start AS duration, query 
+    FROM pg_stat_activity 
+    WHERE backend_type = 'client backend' AND state = 'active' 
+    AND query_start < now() - interval '5 minutes' 
+    ORDER BY duration DESC;
+""")
+
+
 @mcp.tool(
     name='pg_stat_activity_slow_query_last_5mins',
     description='Check currently running slow queries using pg_stat_activity',
@@ -229,18 +282,43 @@ async def pg_stat_activity_slow_query_last_5mins(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Check currently running queries where the state is 'active' and query_start is older than 5 minutes."""
-    logger.info(f'pg_stat_activity_slow_query_last_5mins: {database_instance}')
-
-    sql = """
-        SELECT datname, pid, usename, application_name, client_addr, state, 
-        now() - query_start AS duration, query 
-        FROM pg_stat_activity 
-        WHERE backend_type = 'client backend' AND state = 'active' 
-        AND query_start < now() - interval '5 minutes' 
-        ORDER BY duration DESC;
-    """
+    logger.debug('pg_stat_activity_slow_query_last_5mins: {}', database_instance)
+
+    return await _run_query_unchecked(sql=_SQL_PG_STAT_ACTIVITY_SLOW_QUERY_LAST_5MINS, ctx=ctx)
+
+
+pg_stat_statements_missing_key: Final[str] = 'pg_stat_statements extension is not installed or enabled. Please install and configure the extension.'
+
+_SQL_PG_STAT_STATEMENTS_INSTALLED = "SELECT 1 FROM pg_extension WHERE extname = 'pg_stat_statements'"
 
-    return await run_query(sql=sql, ctx=ctx)
+# Set once the extension has been seen installed, so later calls skip the probe. A missing
+# extension is probed again on each call, since it may be installed while the server runs
+_pg_stat_statements_installed = False
+
+
+async def _check_pg_stat_statements(ctx: Context) -> Optional[list[dict]]:
+    """Return an error response if pg_stat_statements is not installed, otherwise None."""
+    global _pg_stat_statements_installed
+    if _pg_stat_statements_installed:
+        return None
+
+    rows = await _run_query_unchecked(sql=_SQL_PG_STAT_STATEMENTS_INSTALLED, ctx=ctx)
+    if any('error' in row for row in rows):
+        return rows
+    if not rows:
+        logger.warning(pg_stat_statements_missing_key)
+        return [{'error': pg_stat_statements_missing_key}]
+
+    _pg_stat_statements_installed = True
+    return None
+
+
+_SQL_PG_STAT_STATEMENTS = _compact_sql("""
+    SELECT query, total_time, calls, (total_time / calls) AS avg_time 
+    FROM pg_stat_statements 
+    ORDER BY avg_time DESC 
+    LIMIT 10;
+""")
 
 
 @mcp.tool(
@@ -251,23 +329,31 @@ async def pg_stat_statements(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Identify Top SQL Queries by its total execution time per call using pg_stat_statements."""
-    logger.info(f'pg_stat_statements: {database_instance}')
+    logger.debug('pg_stat_statements: {}', database_instance)
 
-    sql = """
-        SELECT query, total_time, calls, (total_time / calls) AS avg_time 
-        FROM pg_stat_statements 
-        ORDER BY avg_time DESC 
-        LIMIT 10;
-    """
+    error = await _check_pg_stat_statements(ctx)
+    if error is not None:
+        return error
 
-    try:
-        return await run_query(sql=sql, ctx=ctx)
-    except Exception as e:
-        if "pg_stat_statements" in str(e):
-            error_msg = "pg_stat_statements extension is not installed or enabled. Please install and configure the extension."
-            logger.warning(error_msg)
-            return [{'error': error_msg}]
-        raise
+    return await _run_query_unchecked(sql=_SQL_PG_STAT_STATEMENTS, ctx=ctx)
+
+
+_SQL_GET_VACUUM_PROGRESS_CURRENT = _compact_sql("""
+    select CURRENT_TIMESTAMP as snapshot_time ,p.pid, now() - a.xact_start AS duration, coalesce(wait_event_type ||'.'|| wait_event, 'CPU') AS wait_event,
+    CASE WHEN a.query ~ '^autovacuum.*to prevent wraparound' THEN 'wraparound' WHEN a.query ~ '^vacuum' THEN 'user' ELSE 'regular' END AS mode,
+    p.datname AS database, p.relid::regclass AS table, p.phase, a.query ,
+    pg_size_pretty(p.heap_blks_total * current_setting('block_size')::int) AS table_size,
+    pg_size_pretty(pg_total_relation_size(p.relid)) AS total_size,
+    pg_size_pretty(p.heap_blks_scanned * current_setting('block_size')::int) AS scanned,
+    pg_size_pretty(p.heap_blks_vacuumed * current_setting('block_size')::int) AS vacuumed,
+    round(100.0 * p.heap_blks_scanned / p.heap_blks_total, 1) AS scanned_pct,
+    round(100.0 * p.heap_blks_vacuumed / p.heap_blks_total, 1) AS vacuumed_pct,
+    p.index_vacuum_count,
+    s.n_dead_tup as total_num_dead_tuples
+    FROM pg_stat_progress_vacuum p JOIN pg_stat_activity a using (pid)
+         join pg_stat_all_tables s on s.relid = p.relid
+    ORDER BY now() - a.xact_start DESC;
+""")
 
 
 @mcp.tool(
@@ -278,26 +364,12 @@ async def get_vacuum_progress_current(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Check the current vacuum progress."""
-    logger.info(f'get_vacuum_progress_current: {database_instance}')
-
-    sql = """
-        select CURRENT_TIMESTAMP as snapshot_time ,p.pid, now() - a.xact_start AS duration, coalesce(wait_event_type ||'.'|| wait_event, 'CPU') AS wait_event,
-        CASE WHEN a.query ~ '^autovacuum.*to prevent wraparound' THEN 'wraparound' WHEN a.query ~ '^vacuum' THEN 'user' ELSE 'regular' END AS mode,
-        p.datname AS database, p.relid::regclass AS table, p.phase, a.query ,
-        pg_size_pretty(p.heap_blks_total * current_setting('block_size')::int) AS table_size,
-        pg_size_pretty(pg_total_relation_size(p.relid)) AS total_size,
-        pg_size_pretty(p.heap_blks_scanned * current_setting('block_size')::int) AS scanned,
-        pg_size_pretty(p.heap_blks_vacuumed * current_setting('block_size')::int) AS vacuumed,
-        round(100.0 * p.heap_blks_scanned / p.heap_blks_total, 1) AS scanned_pct,
-        round(100.0 * p.heap_blks_vacuumed / p.heap_blks_total, 1) AS vacuumed_pct,
-        p.index_vacuum_count,
-        s.n_dead_tup as total_num_dead_tuples
-        FROM pg_stat_progress_vacuum p JOIN pg_stat_activity a using (pid)
-             join pg_stat_all_tables s on s.relid = p.relid
-        ORDER BY now() - a.xact_start DESC;
-    """
+    logger.debug('get_vacuum_progress_current: {}', database_instance)
+
+    return await _run_query_unchecked(sql=_SQL_GET_VACUUM_PROGRESS_CURRENT, ctx=ctx)
 
-    return await run_query(sql=sql, ctx=ctx)
+
+_SQL_OLDEST_XID_ALL_DATABASES = "SELECT max(age(datfrozenxid)) AS oldest_xid FROM pg_database;"
 
 
 @mcp.tool(
@@ -308,11 +380,12 @@ async def oldest_xid_all_databases(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Get oldest transaction ID across all databases in the cluster instance."""
-    logger.info(f'oldest_xid_all_databases: {database_instance}')
+    logger.debug('oldest_xid_all_databases: {}', database_instance)
+
+    return await _run_query_unchecked(sql=_SQL_OLDEST_XID_ALL_DATABASES, ctx=ctx)
 
-    sql = "SELECT max(age(datfrozenxid)) AS oldest_xid FROM pg_database;"
 
-    return await run_query(sql=sql, ctx=ctx)
+_SQL_OLDEST_XID_BY_DATABASE = "SELECT datname, age(datfrozenxid) AS xid_age FROM pg_database ORDER BY xid_age DESC LIMIT 5;"
 
 
 @mcp.tool(
@@ -323,11 +396,23 @@ async def oldest_xid_by_database(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Identify the oldest transaction ID for each database and returns the top 5 databases with the highest XID age."""
-    logger.info(f'oldest_xid_by_database: {database_instance}')
+    logger.debug('oldest_xid_by_database: {}', database_instance)
 
-    sql = "SELECT datname, age(datfrozenxid) AS xid_age FROM pg_database ORDER BY xid_age DESC LIMIT 5;"
+    return await _run_query_unchecked(sql=_SQL_OLDEST_XID_BY_DATABASE, ctx=ctx)
 
-    return await run_query(sql=sql, ctx=ctx)
+
+# Both percentages rise with the XID age, so they are derived from the single max() instead of
+# aggregating each one separately over a joined settings CTE
+_SQL_PERCENT_TOWARDS_XID_WRAPAROUND = _compact_sql("""
+    SELECT oldest_current_xid,
+           ROUND(100*(oldest_current_xid/(2^31-1000000)::float)) AS percent_towards_wraparound,
+           ROUND(100*(oldest_current_xid/current_setting('autovacuum_freeze_max_age')::float)) AS percent_towards_emergency_autovac
+    FROM (
+        SELECT max(age(datfrozenxid)) AS oldest_current_xid
+        FROM pg_catalog.pg_database
+        WHERE datallowconn
+    ) AS oldest;
+""")
 
 
 @mcp.tool(
@@ -338,27 +423,18 @@ async def percent_towards_xid_wraparound(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Calculate the percentage progress towards emergency autovacuum and transaction ID (XID) wraparound across all databases."""
-    logger.info(f'percent_towards_xid_wraparound: {database_instance}')
-
-    sql = """
-        WITH max_age AS (
-            SELECT 2^31-1000000 as max_old_xid, setting AS autovacuum_freeze_max_age
-            FROM pg_catalog.pg_settings WHERE name = 'autovacuum_freeze_max_age'
-        ),
-        per_database_stats AS (
-            SELECT datname, m.max_old_xid::int, m.autovacuum_freeze_max_age::int,
-                   age(d.datfrozenxid) AS oldest_current_xid
-            FROM pg_catalog.pg_database d
-            JOIN max_age m ON (True)
-            WHERE d.datallowconn
-        )
-        SELECT max(oldest_current_xid) AS oldest_current_xid,
-               max(ROUND(100*(oldest_current_xid/max_old_xid::float))) AS percent_towards_wraparound,
-               max(ROUND(100*(oldest_current_xid/autovacuum_freeze_max_age::float))) AS percent_towards_emergency_autovac
-        FROM per_database_stats;
-    """
+    logger.debug('percent_towards_xid_wraparound: {}', database_instance)
+
+    return await _run_query_unchecked(sql=_SQL_PERCENT_TOWARDS_XID_WRAPAROUND, ctx=ctx)
+
 
-    return await run_query(sql=sql, ctx=ctx)
+_SQL_TABLES_WITH_OLDEST_RELFROZEDXID = _compact_sql("""
+    SELECT c.oid::regclass AS table_name, age(c.relfrozenxid) AS xid_age, n.nspname AS schema_name 
+    FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace 
+    WHERE c.relkind = 'r' AND c.relfrozenxid != 0 
+    ORDER BY xid_age DESC 
+    LIMIT 10;
+""")
 
 
 @mcp.tool(
@@ -369,17 +445,24 @@ async def tables_with_oldest_relfrozedxid(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Identify the top 10 tables with the oldest relfrozenxid values, indicating which tables are most in need of vacuuming."""
-    logger.info(f'tables_with_oldest_relfrozedxid: {database_instance}')
-
-    sql = """
-        SELECT c.oid::regclass AS table_name, age(c.relfrozenxid) AS xid_age, n.nspname AS schema_name 
-        FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace 
-        WHERE c.relkind = 'r' AND c.relfrozenxid != 0 
-        ORDER BY xid_age DESC 
-        LIMIT 10;
-    """
+    logger.debug('tables_with_oldest_relfrozedxid: {}', database_instance)
+
+    return await _run_query_unchecked(sql=_SQL_TABLES_WITH_OLDEST_RELFROZEDXID, ctx=ctx)
 
-    return await run_query(sql=sql, ctx=ctx)
+
+_SQL_PG_STAT_TABLES_VACUUM_INFO = _compact_sql("""
+    SELECT schemaname,
+           relname AS table_name,
+           last_vacuum,
+           last_autovacuum,
+           vacuum_count,
+           autovacuum_count,
+           EXTRACT(EPOCH FROM (NOW() - COALESCE(last_vacuum, last_autovacuum)))/86400 AS days_since_last_vacuum
+    FROM pg_stat_all_tables 
+    WHERE (:table_names = '' OR relname = ANY(string_to_array(:table_names, ',')))
+      AND schemaname NOT IN ('information_schema', 'pg_catalog')
+    ORDER BY days_since_last_vacuum DESC NULLS FIRST;
+""")
 
 
 @mcp.tool(
@@ -392,25 +475,69 @@ async def pg_stat_tables_vacuum_info(
     table_names: Annotated[Optional[str], Field(description='Comma-separated list of table names to check (leave empty for all tables)')] = None
 ) -> list[dict]:
     """Retrieve vacuum activity such as most recent vacuum timestamp, vacuum count and days since last vacuum for specified tables or all tables if none specified."""
-    logger.info(f'pg_stat_tables_vacuum_info: {database_instance}, tables: {table_names}')
+    logger.debug('pg_stat_tables_vacuum_info: {}, tables: {}', database_instance, table_names)
 
-    table_names_filter = table_names or ''
-    
-    sql = f"""
-        SELECT schemaname,
-               relname AS table_name,
-               last_vacuum,
-               last_autovacuum,
-               vacuum_count,
-               autovacuum_count,
-               EXTRACT(EPOCH FROM (NOW() - COALESCE(last_vacuum, last_autovacuum)))/86400 AS days_since_last_vacuum
-        FROM pg_stat_all_tables 
-        WHERE ('{table_names_filter}' = '' OR relname = ANY(string_to_array('{table_names_filter}', ',')))
-          AND schemaname NOT IN ('information_schema', 'pg_catalog')
-        ORDER BY days_since_last_vacuum DESC NULLS FIRST;
-    """
+    # Bind the filter instead of splicing it into the SQL, so every call sends the same query text
+    params = [{'name': 'table_names', 'value': {'stringValue': table_names or ''}}]
+
+    return await _run_query_unchecked(sql=_SQL_PG_STAT_TABLES_VACUUM_INFO, ctx=ctx, query_parameters=params)
 
-    return await run_query(sql=sql, ctx=ctx)
+
+_SQL_TABLE_INDEX_BLOAT_ANALYSIS = _compact_sql("""
+    WITH constants AS (
+        SELECT current_setting('block_size')::numeric AS bs,
+            23 AS hdr,
+            4 AS ma
+    ),
+    bloat_info AS (
+        SELECT schemaname,
+            tablename,
+            attname,
+            null_frac,
+            avg_width
+        FROM pg_stats
+        WHERE schemaname NOT IN ('information_schema', 'pg_catalog')
+    ),
+    table_bloat AS (
+        SELECT cc.relnamespace::regnamespace::text schemaname,
+            cc.relname tablename,
+            cc.reltuples,
+            cc.relpages,
+            bs,
+            CEIL((cc.reltuples * (
+                (SELECT SUM( avg_width ) FROM bloat_info bi WHERE bi.tablename = cc.relname and bi.schemaname = cc.relnamespace::regnamespace::text) + 23
+            )) / bs) AS expected_pages,
+            cc.relpages - CEIL((cc.reltuples * (
+                (SELECT SUM(
+                    CASE WHEN avg_width = -1 THEN 10
+                            ELSE avg_width
+                    END
+                ) FROM bloat_info bi WHERE bi.tablename = cc.relname and bi.schemaname = cc.relnamespace::regnamespace::text) + 23
+            )) / bs) AS wasted_pages
+        FROM constants,
+            pg_class cc
+        JOIN pg_namespace nn ON cc.relnamespace = nn.oid
+        WHERE cc.relkind = 'r'
+        AND nn.nspname NOT IN ('information_schema', 'pg_catalog')
+        AND cc.reltuples > 0
+    )
+    SELECT schemaname AS schema_name,
+       tablename AS table_name,
+        reltuples::bigint AS estimated_rows,
+        relpages AS actual_pages,
+        expected_pages,
+        wasted_pages,
+        CASE WHEN relpages > 0
+                THEN ROUND((wasted_pages::numeric / relpages::numeric) * 100, 2)
+                ELSE 0
+        END AS bloat_percentage,
+        pg_size_pretty((wasted_pages * constants.bs)::bigint) AS wasted_space,
+        pg_size_pretty((relpages * constants.bs)::bigint) AS table_size
+    FROM table_bloat, constants
+    WHERE  wasted_pages > 0
+    ORDER BY wasted_pages DESC NULLS LAST
+    LIMIT 20;
+""")
 
 
 @mcp.tool(
@@ -423,65 +550,18 @@ async def table_index_bloat_analysis(
     table_name: Annotated[Optional[str], Field(description='Specific table name to analyze (leave empty to check all tables)')] = None
 ) -> list[dict]:
     """Execute a comprehensive bloat detection query that calculates table and index bloat percentages and wasted space."""
-    logger.info(f'table_index_bloat_analysis: {database_instance}, table: {table_name}')
-
-    sql = """
-        WITH constants AS (
-            SELECT current_setting('block_size')::numeric AS bs,
-                23 AS hdr,
-                4 AS ma
-        ),
-        bloat_info AS (
-            SELECT schemaname,
-                tablename,
-                attname,
-                null_frac,
-                avg_width
-            FROM pg_stats
-            WHERE schemaname NOT IN ('information_schema', 'pg_catalog')
-        ),
-        table_bloat AS (
-            SELECT cc.relnamespace::regnamespace::text schemaname,
-                cc.relname tablename,
-                cc.reltuples,
-                cc.relpages,
-                bs,
-                CEIL((cc.reltuples * (
-                    (SELECT SUM( avg_width ) FROM bloat_info bi WHERE bi.tablename = cc.relname and bi.schemaname = cc.relnamespace::regnamespace::text) + 23
-                )) / bs) AS expected_pages,
-                cc.relpages - CEIL((cc.reltuples * (
-                    (SELECT SUM(
-                        CASE WHEN avg_width = -1 THEN 10
-                                ELSE avg_width
-                        END
-                    ) FROM bloat_info bi WHERE bi.tablename = cc.relname and bi.schemaname = cc.relnamespace::regnamespace::text) + 23
-                )) / bs) AS wasted_pages
-            FROM constants,
-                pg_class cc
-            JOIN pg_namespace nn ON cc.relnamespace = nn.oid
-            WHERE cc.relkind = 'r'
-            AND nn.nspname NOT IN ('information_schema', 'pg_catalog')
-            AND cc.reltuples > 0
-        )
-        SELECT schemaname AS schema_name,
-           tablename AS table_name,
-            reltuples::bigint AS estimated_rows,
-            relpages AS actual_pages,
-            expected_pages,
-            wasted_pages,
-            CASE WHEN relpages > 0
-                    THEN ROUND((wasted_pages::numeric / relpages::numeric) * 100, 2)
-                    ELSE 0
-            END AS bloat_percentage,
-            pg_size_pretty((wasted_pages * constants.bs)::bigint) AS wasted_space,
-            pg_size_pretty((relpages * constants.bs)::bigint) AS table_size
-        FROM table_bloat, constants
-        WHERE  wasted_pages > 0
-        ORDER BY wasted_pages DESC NULLS LAST
-        LIMIT 20;
-    """
+    logger.debug('table_index_bloat_analysis: {}, table: {}', database_instance, table_name)
 
-    return await run_query(sql=sql, ctx=ctx)
+    return await _run_query_unchecked(sql=_SQL_TABLE_INDEX_BLOAT_ANALYSIS, ctx=ctx)
+
+
+_SQL_TABLE_AUTOVACUUM_SETTINGS = _compact_sql("""
+    SELECT n.nspname AS schemaname, c.relname AS tablename, 
+    split_part(option, '=', 1) AS option_name, split_part(option, '=', 2) AS option_value 
+    FROM  pg_class c JOIN  pg_namespace n ON c.relnamespace = n.oid 
+    JOIN  LATERAL unnest(c.reloptions) AS option ON True 
+    WHERE  c.relname = :table_name;
+""")
 
 
 @mcp.tool(
@@ -494,20 +574,49 @@ async def table_autovacuum_settings(
     table_name: Annotated[str, Field(description='Name of the table to check autovacuum settings for')] = None
 ) -> list[dict]:
     """Retrieve table-specific autovacuum configuration parameters and compare them with global defaults."""
-    logger.info(f'table_autovacuum_settings: {database_instance}, table: {table_name}')
+    logger.debug('table_autovacuum_settings: {}, table: {}', database_instance, table_name)
 
     if not table_name:
         return [{'error': 'table_name parameter is required'}]
 
-    sql = f"""
-        SELECT n.nspname AS schemaname, c.relname AS tablename, 
-        split_part(option, '=', 1) AS option_name, split_part(option, '=', 2) AS option_value 
-        FROM  pg_class c JOIN  pg_namespace n ON c.relnamespace = n.oid 
-        JOIN  LATERAL unnest(c.reloptions) AS option ON True 
-        WHERE  c.relname = '{table_name}';
-    """
+    params = [{'name': 'table_name', 'value': {'stringValue': table_name}}]
 
-    return await run_query(sql=sql, ctx=ctx)
+    return await _run_query_unchecked(sql=_SQL_TABLE_AUTOVACUUM_SETTINGS, ctx=ctx, query_parameters=params)
+
+
+_SQL_TABLES_ELIGIBLE_FOR_VACUUM = _compact_sql("""
+    WITH vbt AS (SELECT setting AS autovacuum_vacuum_threshold FROM pg_settings WHERE name = 'autovacuum_vacuum_threshold'),
+         vsf AS (SELECT setting AS autovacuum_vacuum_scale_factor FROM pg_settings WHERE name = 'autovacuum_vacuum_scale_factor'),
+         fma AS (SELECT setting AS autovacuum_freeze_max_age FROM pg_settings WHERE name = 'autovacuum_freeze_max_age'),
+         sto AS (
+            SELECT opt_oid, split_part(setting, '=', 1) AS param, split_part(setting, '=', 2) AS value
+            FROM (SELECT oid opt_oid, unnest(reloptions) setting FROM pg_class) opt
+         )
+    SELECT
+        ns.nspname||'.'||c.relname AS relation,
+        pg_size_pretty(pg_table_size(c.oid)) AS table_size,
+        age(relfrozenxid) AS xid_age,
+        coalesce(cfma.value::float, autovacuum_freeze_max_age::float) AS autovacuum_freeze_max_age,
+        (coalesce(cvbt.value::float, autovacuum_vacuum_threshold::float) + coalesce(cvsf.value::float,autovacuum_vacuum_scale_factor::float) * c.reltuples) AS autovacuum_vacuum_tuples,
+        n_dead_tup AS dead_tuples,
+        cfav.value AS autovacuum_enabled
+    FROM pg_class c
+    JOIN pg_namespace ns ON ns.oid = c.relnamespace
+    JOIN pg_stat_all_tables stat ON stat.relid = c.oid
+    JOIN vbt ON (1=1) JOIN vsf ON (1=1) JOIN fma ON (1=1)
+    LEFT JOIN sto cvbt ON cvbt.param = 'autovacuum_vacuum_threshold' AND c.oid = cvbt.opt_oid
+    LEFT JOIN sto cvsf ON cvsf.param = 'autovacuum_vacuum_scale_factor' AND c.oid = cvsf.opt_oid
+    LEFT JOIN sto cfma ON cfma.param = 'autovacuum_freeze_max_age' AND c.oid = cfma.opt_oid
+    LEFT JOIN sto cfav ON cfav.param = 'autovacuum_enabled' AND c.oid = cfav.opt_oid
+    WHERE c.relkind IN ('r', 't')
+      AND (
+        age(relfrozenxid) >= coalesce(cfma.value::float, autovacuum_freeze_max_age::float)
+        OR
+        coalesce(cvbt.value::float, autovacuum_vacuum_threshold::float) + coalesce(cvsf.value::float,autovacuum_vacuum_scale_factor::float) * c.reltuples <= n_dead_tup
+      )
+    ORDER BY age(relfrozenxid) DESC
+    LIMIT 10;
+""")
 
 
 @mcp.tool(
@@ -518,43 +627,18 @@ async def tables_eligible_for_vacuum(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Identify the top 10 tables that are currently eligible for vacuum based on dead tuples and autovacuum thresholds."""
-    logger.info(f'tables_eligible_for_vacuum: {database_instance}')
-
-    sql = """
-        WITH vbt AS (SELECT setting AS autovacuum_vacuum_threshold FROM pg_settings WHERE name = 'autovacuum_vacuum_threshold'),
-             vsf AS (SELECT setting AS autovacuum_vacuum_scale_factor FROM pg_settings WHERE name = 'autovacuum_vacuum_scale_factor'),
-             fma AS (SELECT setting AS autovacuum_freeze_max_age FROM pg_settings WHERE name = 'autovacuum_freeze_max_age'),
-             sto AS (
-                SELECT opt_oid, split_part(setting, '=', 1) AS param, split_part(setting, '=', 2) AS value
-                FROM (SELECT oid opt_oid, unnest(reloptions) setting FROM pg_class) opt
-             )
-        SELECT
-            ns.nspname||'.'||c.relname AS relation,
-            pg_size_pretty(pg_table_size(c.oid)) AS table_size,
-            age(relfrozenxid) AS xid_age,
-            coalesce(cfma.value::float, autovacuum_freeze_max_age::float) AS autovacuum_freeze_max_age,
-            (coalesce(cvbt.value::float, autovacuum_vacuum_threshold::float) + coalesce(cvsf.value::float,autovacuum_vacuum_scale_factor::float) * c.reltuples) AS autovacuum_vacuum_tuples,
-            n_dead_tup AS dead_tuples,
-            cfav.value AS autovacuum_enabled
-        FROM pg_class c
-        JOIN pg_namespace ns ON ns.oid = c.relnamespace
-        JOIN pg_stat_all_tables stat ON stat.relid = c.oid
-        JOIN vbt ON (1=1) JOIN vsf ON (1=1) JOIN fma ON (1=1)
-        LEFT JOIN sto cvbt ON cvbt.param = 'autovacuum_vacuum_threshold' AND c.oid = cvbt.opt_oid
-        LEFT JOIN sto cvsf ON cvsf.param = 'autovacuum_vacuum_scale_factor' AND c.oid = cvsf.opt_oid
-        LEFT JOIN sto cfma ON cfma.param = 'autovacuum_freeze_max_age' AND c.oid = cfma.opt_oid
-        LEFT JOIN sto cfav ON cfav.param = 'autovacuum_enabled' AND c.oid = cfav.opt_oid
-        WHERE c.relkind IN ('r', 't')
-          AND (
-            age(relfrozenxid) >= coalesce(cfma.value::float, autovacuum_freeze_max_age::float)
-            OR
-            coalesce(cvbt.value::float, autovacuum_vacuum_threshold::float) + coalesce(cvsf.value::float,autovacuum_vacuum_scale_factor::float) * c.reltuples <= n_dead_tup
-          )
-        ORDER BY age(relfrozenxid) DESC
-        LIMIT 10;
-    """
+    logger.debug('tables_eligible_for_vacuum: {}', database_instance)
 
-    return await run_query(sql=sql, ctx=ctx)
+    return await _run_query_unchecked(sql=_SQL_TABLES_ELIGIBLE_FOR_VACUUM, ctx=ctx)
+
+
+_SQL_TABLES_HIGH_DEAD_TUPLE_RATIO = _compact_sql("""
+    SELECT schemaname, relname, last_vacuum, last_autovacuum, n_live_tup, n_dead_tup, 
+    trunc((n_dead_tup::numeric/nullif(n_live_tup+n_dead_tup,0))* 100,2) AS n_dead_tup_percent 
+    FROM pg_stat_user_tables 
+    WHERE n_dead_tup::float/nullif(n_live_tup+n_dead_tup,0) > 0.2 
+    ORDER BY n_live_tup DESC;
+""")
 
 
 @mcp.tool(
@@ -565,17 +649,39 @@ async def tables_high_dead_tuple_ratio(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Identify tables with more than 20% dead tuples, indicating potential bloat and need for vacuum attention."""
-    logger.info(f'tables_high_dead_tuple_ratio: {database_instance}')
-
-    sql = """
-        SELECT schemaname, relname, last_vacuum, last_autovacuum, n_live_tup, n_dead_tup, 
-        trunc((n_dead_tup::numeric/nullif(n_live_tup+n_dead_tup,0))* 100,2) AS n_dead_tup_percent 
-        FROM pg_stat_user_tables 
-        WHERE n_dead_tup::float/nullif(n_live_tup+n_dead_tup,0) > 0.2 
-        ORDER BY n_live_tup DESC;
-    """
-
-    return await run_query(sql=sql, ctx=ctx)
+    logger.debug('tables_high_dead_tuple_ratio: {}', database_instance)
+
+    return await _run_query_unchecked(sql=_SQL_TABLES_HIGH_DEAD_TUPLE_RATIO, ctx=ctx)
+
+
+_SQL_LONG_RUNNING_TRANSACTIONS = _compact_sql("""
+    SELECT pid,
+        datname AS database_name,
+        usename AS username,
+        application_name,
+        state,
+        now() - xact_start AS transaction_duration,
+        now() - query_start AS query_duration,
+        EXTRACT(EPOCH FROM (now() - xact_start)) AS transaction_duration_seconds,
+        EXTRACT(EPOCH FROM (now() - query_start)) AS query_duration_seconds,
+        xact_start AS transaction_start_time,
+        query_start AS query_start_time,
+        wait_event_type,
+        wait_event,
+        backend_type,
+        CASE 
+            WHEN LENGTH(query) > 100 THEN LEFT(query, 100) || '...'
+            ELSE query
+        END AS query_preview,
+        query AS full_query
+    FROM pg_stat_activity
+    WHERE state != 'idle'
+    AND xact_start IS NOT NULL
+    AND backend_type = 'client backend'
+    AND pid != pg_backend_pid()  /* Exclude current session */
+    ORDER BY transaction_duration DESC
+    LIMIT 15;
+""")
 
 
 @mcp.tool(
@@ -586,38 +692,50 @@ async def long_running_transactions(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Identify long-running transactions that may be blocking autovacuum or causing performance issues."""
-    logger.info(f'long_running_transactions: {database_instance}')
-
-    sql = """
-        SELECT pid,
-            datname AS database_name,
-            usename AS username,
-            application_name,
-            state,
-            now() - xact_start AS transaction_duration,
-            now() - query_start AS query_duration,
-            EXTRACT(EPOCH FROM (now() - xact_start)) AS transaction_duration_seconds,
-            EXTRACT(EPOCH FROM (now() - query_start)) AS query_duration_seconds,
-            xact_start AS transaction_start_time,
-            query_start AS query_start_time,
-            wait_event_type,
-            wait_event,
-            backend_type,
-            CASE 
-                WHEN LENGTH(query) > 100 THEN LEFT(query, 100) || '...'
-                ELSE query
-            END AS query_preview,
-            query AS full_query
-        FROM pg_stat_activity
-        WHERE state != 'idle'
-        AND xact_start IS NOT NULL
-        AND backend_type = 'client backend'
-        AND pid != pg_backend_pid()  -- Exclude current session
-        ORDER BY transaction_duration DESC
-        LIMIT 15;
-    """
-
-    return await run_query(sql=sql, ctx=ctx)
+    logger.debug('long_running_transactions: {}', database_instance)
+
+    return await _run_query_unchecked(sql=_SQL_LONG_RUNNING_TRANSACTIONS, ctx=ctx)
+
+
+_SQL_INACTIVE_REPLICATION_SLOTS = _compact_sql("""
+    SELECT slot_name,
+        slot_type,
+        database,
+        active,
+        active_pid,
+        restart_lsn::text,
+        confirmed_flush_lsn::text,
+        wal_status,
+        safe_wal_size,
+        two_phase,
+        temporary,
+        CASE 
+            WHEN active = false AND restart_lsn IS NOT NULL THEN 
+                pg_size_pretty(pg_wal_lsn_diff(pg_current_wal_lsn(), restart_lsn))
+            ELSE 'N/A'
+        END AS wal_lag_size,
+        CASE 
+            WHEN active = false AND restart_lsn IS NOT NULL THEN 
+                pg_wal_lsn_diff(pg_current_wal_lsn(), restart_lsn)
+            ELSE 0
+        END AS wal_lag_bytes,
+        CASE 
+            WHEN active = false THEN 'Inactive - may prevent WAL cleanup'
+            WHEN wal_status = 'lost' THEN 'WAL files lost - slot may be broken'
+            WHEN wal_status = 'unreserved' THEN 'WAL not reserved - potential issue'
+            ELSE 'Active and healthy'
+        END AS status_description,
+        /* Estimate potential disk space that could be freed */
+        CASE 
+            WHEN active = false AND restart_lsn IS NOT NULL THEN
+                'Potential space savings: ' || pg_size_pretty(pg_wal_lsn_diff(pg_current_wal_lsn(), restart_lsn))
+            ELSE 'No immediate space impact'
+        END AS space_impact
+    FROM pg_replication_slots
+    ORDER BY 
+        CASE WHEN active = false THEN 0 ELSE 1 END,
+        wal_lag_bytes DESC NULLS LAST;
+""")
 
 
 @mcp.tool(
@@ -628,49 +746,16 @@ async def inactive_replication_slots(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Identify inactive replication slots that may be preventing WAL cleanup and causing disk space issues."""
-    logger.info(f'inactive_replication_slots: {database_instance}')
-
-    sql = """
-        SELECT slot_name,
-            slot_type,
-            database,
-            active,
-            active_pid,
-            restart_lsn::text,
-            confirmed_flush_lsn::text,
-            wal_status,
-            safe_wal_size,
-            two_phase,
-            temporary,
-            CASE 
-                WHEN active = false AND restart_lsn IS NOT NULL THEN 
-                    pg_size_pretty(pg_wal_lsn_diff(pg_current_wal_lsn(), restart_lsn))
-                ELSE 'N/A'
-            END AS wal_lag_size,
-            CASE 
-                WHEN active = false AND restart_lsn IS NOT NULL THEN 
-                    pg_wal_lsn_diff(pg_current_wal_lsn(), restart_lsn)
-                ELSE 0
-            END AS wal_lag_bytes,
-            CASE 
-                WHEN active = false THEN 'Inactive - may prevent WAL cleanup'
-                WHEN wal_status = 'lost' THEN 'WAL files lost - slot may be broken'
-                WHEN wal_status = 'unreserved' THEN 'WAL not reserved - potential issue'
-                ELSE 'Active and healthy'
-            END AS status_description,
-            -- Estimate potential disk space that could be freed
-            CASE 
-                WHEN active = false AND restart_lsn IS NOT NULL THEN
-                    'Potential space savings: ' || pg_size_pretty(pg_wal_lsn_diff(pg_current_wal_lsn(), restart_lsn))
-                ELSE 'No immediate space impact'
-            END AS space_impact
-        FROM pg_replication_slots
-        ORDER BY 
-            CASE WHEN active = false THEN 0 ELSE 1 END,
-            wal_lag_bytes DESC NULLS LAST;
-    """
+    logger.debug('inactive_replication_slots: {}', database_instance)
 
-    return await run_query(sql=sql, ctx=ctx)
+    return await _run_query_unchecked(sql=_SQL_INACTIVE_REPLICATION_SLOTS, ctx=ctx)
+
+
+_SQL_PREPARED_TRANSACTIONS_CHECK = _compact_sql("""
+    SELECT transaction::text, gid, prepared, owner, database 
+    FROM pg_prepared_xacts 
+    WHERE prepared < now() - interval '15 minutes';
+""")
 
 
 @mcp.tool(
@@ -681,15 +766,17 @@ async def prepared_transactions_check(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Monitor all prepared transactions and identify potential issues."""
-    logger.info(f'prepared_transactions_check: {database_instance}')
+    logger.debug('prepared_transactions_check: {}', database_instance)
+
+    return await _run_query_unchecked(sql=_SQL_PREPARED_TRANSACTIONS_CHECK, ctx=ctx)
 
-    sql = """
-        SELECT transaction::text, gid, prepared, owner, database 
-        FROM pg_prepared_xacts 
-        WHERE prepared < now() - interval '15 minutes';
-    """
 
-    return await run_query(sql=sql, ctx=ctx)
+_SQL_PG_STAT_STATEMENTS_BY_CALLS = _compact_sql("""
+    SELECT query, calls, total_time, (total_time / calls) AS avg_time 
+    FROM pg_stat_statements 
+    ORDER BY calls DESC 
+    LIMIT 10;
+""")
 
 
 @mcp.tool(
@@ -700,30 +787,180 @@ async def pg_stat_statements_by_calls(
     ctx: Context, database_instance: Annotated[Optional[str], Field(description='Database instance identifier')] = None
 ) -> list[dict]:
     """Identify top queries by its number of calls using pg_stat_statements."""
-    logger.info(f'pg_stat_statements_by_calls: {database_instance}')
+    logger.debug('pg_stat_statements_by_calls: {}', database_instance)
+
+    error = await _check_pg_stat_statements(ctx)
+    if error is not None:
+        return error
+
+    return await _run_query_unchecked(sql=_SQL_PG_STAT_STATEMENTS_BY_CALLS, ctx=ctx)
+
+
+# Upper bound on diagnostics a bundle runs at once
+MAX_CONCURRENT_BUNDLE_DIAGNOSTICS = 4
+
+# SQL and query parameters of the diagnostics a bundle can run, by tool name. These are the
+# tools that need no arguments beyond the optional database_instance
+_BUNDLE_DIAGNOSTICS: Final[Dict[str, Tuple[str, Optional[List[Dict[str, Any]]]]]] = {
+    'pg_stat_activity_slow_query_last_5mins': (_SQL_PG_STAT_ACTIVITY_SLOW_QUERY_LAST_5MINS, None),
+    'pg_stat_statements': (_SQL_PG_STAT_STATEMENTS, None),
+    'get_vacuum_progress_current': (_SQL_GET_VACUUM_PROGRESS_CURRENT, None),
+    'oldest_xid_all_databases': (_SQL_OLDEST_XID_ALL_DATABASES, None),
+    'oldest_xid_by_database': (_SQL_OLDEST_XID_BY_DATABASE, None),
+    'percent_towards_xid_wraparound': (_SQL_PERCENT_TOWARDS_XID_WRAPAROUND, None),
+    'tables_with_oldest_relfrozedxid': (_SQL_TABLES_WITH_OLDEST_RELFROZEDXID, None),
+    'pg_stat_tables_vacuum_info': (
+        _SQL_PG_STAT_TABLES_VACUUM_INFO,
+        [{'name': 'table_names', 'value': {'stringValue': ''}}],
+    ),
+    'table_index_bloat_analysis': (_SQL_TABLE_INDEX_BLOAT_ANALYSIS, None),
+    'tables_eligible_for_vacuum': (_SQL_TABLES_ELIGIBLE_FOR_VACUUM, None),
+    'tables_high_dead_tuple_ratio': (_SQL_TABLES_HIGH_DEAD_TUPLE_RATIO, None),
+    'long_running_transactions': (_SQL_LONG_RUNNING_TRANSACTIONS, None),
+    'inactive_replication_slots': (_SQL_INACTIVE_REPLICATION_SLOTS, None),
+    'prepared_transactions_check': (_SQL_PREPARED_TRANSACTIONS_CHECK, None),
+    'pg_stat_statements_by_calls': (_SQL_PG_STAT_STATEMENTS_BY_CALLS, None),
+}
+
+# Bundle diagnostics that read pg_stat_statements, so the extension is checked first
+_PG_STAT_STATEMENTS_DIAGNOSTICS = frozenset({'pg_stat_statements', 'pg_stat_statements_by_calls'})
+
+
+def _bundle_concurrency(db_connection) -> int:
+    """Return how many diagnostics a bundle may run at once on the connection.
+
+    A psycopg pool gets a quarter of its max_size, so a bundle leaves most pooled connections
+    to concurrent tool calls. RDS Data API calls hold no database connection of their own.
+    """
+    if isinstance(db_connection, PsycopgPoolConnection):
+        return max(1, min(MAX_CONCURRENT_BUNDLE_DIAGNOSTICS, db_connection.max_size // 4))
+    return MAX_CONCURRENT_BUNDLE_DIAGNOSTICS
+
 
-    sql = """
-        SELECT query, calls, total_time, (total_time / calls) AS avg_time 
-        FROM pg_stat_statements 
-        ORDER BY calls DESC 
-        LIMIT 10;
+@mcp.tool(
+    name='run_diagnostic_bundle',
+    description='Run several diagnostic tools concurrently and return their results by tool name',
+)
+async def run_diagnostic_bundle(
+    ctx: Context,
+    names: Annotated[
+        List[str],
+        Field(description=f'Diagnostic tools to run, any of: {", ".join(_BUNDLE_DIAGNOSTICS)}'),
+    ],
+    database_instance: Annotated[
+        Optional[str], Field(description='Database instance identifier')
+    ] = None,
+) -> dict[str, list[dict]]:
+    """Run the named diagnostics' SQL concurrently across pooled connections, a few at a time.
+
+    Args:
+        ctx: MCP context for logging and state management
+        names: names of the diagnostic tools to run
+        database_instance: Database instance identifier
+
+    Returns:
+        Dictionary mapping each requested tool name to its query response rows
     """
+    logger.debug('run_diagnostic_bundle: {}, diagnostics: {}', database_instance, names)
+
+    db_connection = await _resolve_db_connection(None, ctx)
+    if db_connection is None:
+        return {name: [{'error': 'No database connection available'}] for name in names}
+
+    names = list(dict.fromkeys(names))
+    known = [name for name in names if name in _BUNDLE_DIAGNOSTICS]
+    semaphore = asyncio.Semaphore(_bundle_concurrency(db_connection))
+
+    async def run_diagnostic(name: str) -> list[dict]:
+        async with semaphore:
+            if name in _PG_STAT_STATEMENTS_DIAGNOSTICS:
+                error = await _check_pg_stat_statements(ctx)
+                if error is not None:
+                    return error
+            sql, params = _BUNDLE_DIAGNOSTICS[name]
+            return await _run_query_unchecked(
+                sql=sql, ctx=ctx, db_connection=db_connection, query_parameters=params
+            )
+
+    results = await asyncio.gather(*(run_diagnostic(name) for name in known))
+    by_name = dict(zip(known, results))
+    return {
+        name: by_name[name] if name in by_name else [{'error': f'Unknown diagnostic: {name}'}]
+        for name in names
+    }
+
 
+def _run_on_uvloop_if_available(coro: Coroutine[Any, Any, bool]) -> bool:
+    """Run the coroutine on a uvloop event loop when uvloop is installed, else on the stdlib loop."""
     try:
-        return await run_query(sql=sql, ctx=ctx)
-    except Exception as e:
-        if "pg_stat_statements" in str(e):
-            error_msg = "pg_stat_statements extension is not installed or enabled. Please install and configure the extension."
-            logger.warning(error_msg)
-            return [{'error': error_msg}]
-        raise
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    # The connection check and every await on a database round trip while serving run on this
+    # one loop; uvloop.run creates it directly, without the event loop policy API
+    return uvloop.run(coro)
+
+
+@dataclass(frozen=True, slots=True)
+class ServerConfig:
+    """Server settings taken from the environment, read once at start-up."""
+
+    mcp_host: Optional[str]
+    mcp_port: Optional[int]
+    pool_min_size: int
+    pool_max_size: int
+
+    @classmethod
+    def from_env(cls) -> 'ServerConfig':
+        """Build the config from the current process environment."""
+        port = os.environ.get('MCP_PORT')
+        return cls(
+            mcp_host=os.environ.get('MCP_HOST') or None,
+            mcp_port=int(port) if port else None,
+            pool_min_size=int(os.environ.get('POSTGRES_POOL_MIN_SIZE', '1')),
+            pool_max_size=int(os.environ.get('POSTGRES_POOL_MAX_SIZE', '10')),
+        )
+
+
+async def _validate_and_serve(db_connection, config: ServerConfig) -> bool:
+    """Validate the database connection, then serve MCP requests on the same event loop.
+
+    Returns:
+        False if the connection could not be validated, True once the server has stopped
+    """
+    try:
+        # A bare round trip, skipping run_query's checks and result conversion; the health
+        # check logs the underlying error itself
+        if not await db_connection.check_connection_health():
+            logger.error('Failed to validate database connection to Postgres. Exit the MCP server')
+            return False
+
+        logger.success('Successfully validated database connection to Postgres')
+        logger.info('Starting Postgres MCP server')
+
+        # Check if we should run in HTTP mode (for ECS deployment)
+        if config.mcp_host and config.mcp_port:
+            logger.info('Running in HTTP mode on {}:{}', config.mcp_host, config.mcp_port)
+            mcp.settings.host = config.mcp_host
+            mcp.settings.port = config.mcp_port
+            await mcp.run_streamable_http_async()
+        else:
+            logger.info('Running in stdio mode')
+            await mcp.run_stdio_async()
+        return True
+    finally:
+        await db_connection.close()
 
 
 def main():
     """Main entry point for the MCP server application."""
-    global client_error_code_key
+    # Replace loguru's DEBUG-level default sink, so the per-query debug lines are dropped before
+    # formatting unless FASTMCP_LOG_LEVEL asks for them. Done here rather than at import, so
+    # importing the module keeps the host's sinks
+    logger.remove()
+    logger.add(sys.stderr, level=os.getenv('FASTMCP_LOG_LEVEL', 'INFO'))
 
-    """Run the MCP server with CLI argument support."""
     parser = argparse.ArgumentParser(
         description='An AWS Labs Model Context Protocol (MCP) server for postgres'
     )
@@ -746,35 +983,39 @@ def main():
     parser.add_argument('--readonly', required=True, help='Enforce readonly SQL statements')
 
     args = parser.parse_args()
+    config = ServerConfig.from_env()
 
-    # Validate connection parameters
-    if not args.resource_arn and not args.hostname:
-        parser.error(
-            'Either --resource_arn (for RDS Data API) or '
-            '--hostname (for direct PostgreSQL) must be provided'
-        )
-
-    if args.resource_arn and args.hostname:
+    # Validate connection parameters: exactly one connection method must be given
+    if bool(args.resource_arn) == bool(args.hostname):
         parser.error(
             'Cannot specify both --resource_arn and --hostname. Choose one connection method.'
+            if args.resource_arn
+            else 'Either --resource_arn (for RDS Data API) or '
+            '--hostname (for direct PostgreSQL) must be provided'
         )
 
-    # Convert args to dict for easier handling
-    connection_params = vars(args)
-
     # Convert readonly string to boolean
-    connection_params['readonly'] = args.readonly.lower() == 'true'
+    readonly = args.readonly.lower() == 'true'
 
     # Log connection information
     connection_target = args.resource_arn if args.resource_arn else f'{args.hostname}:{args.port}'
 
     if args.resource_arn:
         logger.info(
-            f'Postgres MCP init with RDS Data API: CONNECTION_TARGET:{connection_target}, SECRET_ARN:{args.secret_arn}, REGION:{args.region}, DATABASE:{args.database}, READONLY:{args.readonly}'
+            'Postgres MCP init with RDS Data API: CONNECTION_TARGET:{}, SECRET_ARN:{}, REGION:{}, DATABASE:{}, READONLY:{}',
+            connection_target,
+            args.secret_arn,
+            args.region,
+            args.database,
+            readonly,
         )
     else:
         logger.info(
-            f'Postgres MCP init with psycopg: CONNECTION_TARGET:{connection_target}, PORT:{args.port}, DATABASE:{args.database}, READONLY:{args.readonly}'
+            'Postgres MCP init with psycopg: CONNECTION_TARGET:{}, PORT:{}, DATABASE:{}, READONLY:{}',
+            connection_target,
+            args.port,
+            args.database,
+            readonly,
         )
 
     # Create the appropriate database connection based on the provided parameters
@@ -790,13 +1031,13 @@ def main():
                     secret_arn=args.secret_arn,
                     database=args.database,
                     region=args.region,
-                    readonly=connection_params['readonly'],
+                    readonly=readonly,
                 )
 
                 # Get the connection from the singleton
                 db_connection = DBConnectionSingleton.get().db_connection
             except Exception as e:
-                logger.exception(f'Failed to create RDS Data API connection: {str(e)}')
+                logger.exception('Failed to create RDS Data API connection: {}', e)
                 sys.exit(1)
 
         else:
@@ -807,50 +1048,27 @@ def main():
                     host=args.hostname,
                     port=args.port,
                     database=args.database,
-                    readonly=connection_params['readonly'],
+                    readonly=readonly,
                     secret_arn=args.secret_arn,
                     region=args.region,
+                    min_size=config.pool_min_size,
+                    max_size=config.pool_max_size,
                 )
-                # Store the connection globally for access by MCP tools
-                global _global_db_connection
-                _global_db_connection = db_connection
+                # Share the connection with the MCP tools through the singleton
+                DBConnectionSingleton.set_connection(db_connection)
             except Exception as e:
-                logger.exception(f'Failed to create PostgreSQL connection: {str(e)}')
+                logger.exception('Failed to create PostgreSQL connection: {}', e)
                 sys.exit(1)
 
     except BotoCoreError as e:
-        logger.exception(f'Failed to create database connection: {str(e)}')
+        logger.exception('Failed to create database connection: {}', e)
         sys.exit(1)
 
-    # Test database connection
-    ctx = DummyCtx()
-    response = asyncio.run(run_query('SELECT 1', ctx, db_connection))
-    if (
-        isinstance(response, list)
-        and len(response) == 1
-        and isinstance(response[0], dict)
-        and 'error' in response[0]
-    ):
-        logger.error('Failed to validate database connection to Postgres. Exit the MCP server')
+    # Validate and serve on one event loop, so the pool opened by the health check is the one
+    # the tools use
+    if not _run_on_uvloop_if_available(_validate_and_serve(db_connection, config)):
         sys.exit(1)
 
-    logger.success('Successfully validated database connection to Postgres')
-
-    logger.info('Starting Postgres MCP server')
-    
-    # Check if we should run in HTTP mode (for ECS deployment)
-    import os
-    if os.getenv('MCP_HOST') and os.getenv('MCP_PORT'):
-        host = os.getenv('MCP_HOST', '0.0.0.0')
-        port = int(os.getenv('MCP_PORT', '8000'))
-        logger.info(f'Running in HTTP mode on {host}:{port}')
-        mcp.settings.host = host
-        mcp.settings.port = port
-        mcp.run(transport="streamable-http")
-    else:
-        logger.info('Running in stdio mode')
-        mcp.run()
-
 
 if __name__ == '__main__':
     main()
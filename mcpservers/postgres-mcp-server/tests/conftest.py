@@ -245,6 +245,22 @@ class Mock_DBConnection:
             # Execute the query directly
             return self.data_client.execute_statement(sql=sql, parameters=parameters)
 
+    async def close(self) -> None:
+        """Close the connection; the mock holds no resources."""
+        pass
+
+    async def check_connection_health(self) -> bool:
+        """Check the connection health the way RDSDataAPIConnection does.
+
+        Returns:
+            bool: True if SELECT 1 returned a row, False otherwise
+        """
+        try:
+            result = await self.execute_query('SELECT 1')
+            return len(result.get('records', [])) > 0
+        except Exception:
+            return False
+
 
 class DummyCtx:
     """Mock implementation of MCP context for testing purposes."""
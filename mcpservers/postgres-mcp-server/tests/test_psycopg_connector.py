@@ -13,14 +13,44 @@
 # limitations under the License.
 """Tests for the psycopg connector functionality."""
 
+import asyncio
 import concurrent.futures
+import psycopg
 import pytest
 import threading
 import time
+from awslabs.postgres_mcp_server.connection import psycopg_pool_connection
 from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import PsycopgPoolConnection
+from decimal import Decimal
+from enum import IntEnum
+from psycopg.conninfo import conninfo_to_dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
+def _mock_connection(rows, description):
+    """Build a mocked pooled connection whose cursor returns the given rows."""
+    cursor = MagicMock()
+    cursor.execute = AsyncMock()
+    cursor.description = description
+    cursor_cm = MagicMock()
+    cursor_cm.__aenter__.return_value = cursor
+
+    def _cursor(row_factory=None):
+        # Shape the rows the way psycopg would with the requested row factory
+        make_row = row_factory(cursor) if row_factory else tuple
+        cursor.__aiter__.return_value = [make_row(list(row)) for row in rows]
+        return cursor_cm
+
+    conn = MagicMock()
+    conn.execute = AsyncMock()
+    conn.pipeline.return_value.__aenter__.return_value.sync = AsyncMock()
+    conn.cursor.side_effect = _cursor
+
+    connection_cm = MagicMock()
+    connection_cm.__aenter__.return_value = conn
+    return connection_cm, conn, cursor
+
+
 class TestPsycopgConnector:
     """Tests for the PsycopgPoolConnection class."""
 
@@ -59,36 +89,30 @@ class TestPsycopgConnector:
         assert kwargs['timeout'] == 15.0  # Verify our modified timeout
 
     @pytest.mark.asyncio
-    @patch('psycopg_pool.AsyncConnectionPool')
-    async def test_psycopg_connection_readonly_timeout(self, mock_connection_pool):
-        """Test that _set_all_connections_readonly uses the correct timeout."""
-        # Setup mock
-        mock_pool = AsyncMock()
-        mock_conn = AsyncMock()
-        mock_pool.connection.return_value.__aenter__.return_value = mock_conn
-        mock_connection_pool.return_value = mock_pool
-
-        # Create connection with readonly=True
+    @pytest.mark.parametrize('readonly', [True, False])
+    @patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.AsyncConnectionPool')
+    async def test_readonly_pool_sets_session_option(self, mock_pool_class, readonly):
+        """Test that readonly pools make every session read-only through the startup options."""
+        mock_pool_class.return_value = AsyncMock()
         conn = PsycopgPoolConnection(
             host='localhost',
             port=5432,
             database='test_db',
-            readonly=True,
+            readonly=readonly,
             secret_arn='test_secret_arn',  # pragma: allowlist secret
             region='us-east-1',
             is_test=True,
         )
 
-        # Manually set the pool attribute since is_test=True skips pool initialization
-        conn.pool = mock_pool
-
-        # Now we can call _set_all_connections_readonly manually
-        await conn._set_all_connections_readonly()
+        await conn.initialize_pool()
 
-        # Verify connection.pool.connection was called with timeout=15.0
-        mock_pool.connection.assert_called_once()
-        args, kwargs = mock_pool.connection.call_args
-        assert kwargs['timeout'] == 15.0  # Verify our modified timeout
+        conninfo = conninfo_to_dict(mock_pool_class.call_args[0][0])
+        if readonly:
+            assert conninfo['options'] == '-c default_transaction_read_only=on'
+        else:
+            assert 'options' not in conninfo
+        # The role's settings are left untouched
+        mock_pool_class.return_value.connection.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_psycopg_connection_execute_query(self, mock_PsycopgPoolConnection):
@@ -200,6 +224,321 @@ class TestPsycopgConnector:
         # Verify the max_size attribute was set correctly
         assert conn.max_size == 10
 
+    @patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.boto3.Session')
+    def test_credentials_from_secret_are_cached(self, mock_session):
+        """Test that repeated lookups of the same secret reuse the cached credentials."""
+        mock_client = mock_session.return_value.client.return_value
+        mock_client.get_secret_value.return_value = {
+            'SecretString': '{"username": "db_user", "password": "db_password"}'  # pragma: allowlist secret
+        }
+
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=True,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            is_test=True,
+        )
+
+        psycopg_pool_connection._secrets_manager_client.cache_clear()
+        with patch.dict(psycopg_pool_connection._secret_cache, clear=True):
+            first = conn._get_credentials_from_secret('cached_secret_arn', 'us-east-1')
+            second = conn._get_credentials_from_secret('cached_secret_arn', 'us-east-1')
+            assert first == second == ('db_user', 'db_password')
+            assert mock_client.get_secret_value.call_count == 1
+
+            # A different region is looked up separately
+            conn._get_credentials_from_secret('cached_secret_arn', 'us-west-2')
+            assert mock_client.get_secret_value.call_count == 2
+
+        # One client per region, created with the fail-fast config
+        mock_session.return_value.client.assert_called_with(
+            service_name='secretsmanager',
+            region_name='us-west-2',
+            config=psycopg_pool_connection.SECRETS_MANAGER_CLIENT_CONFIG,
+        )
+        assert mock_session.return_value.client.call_count == 2
+        psycopg_pool_connection._secrets_manager_client.cache_clear()
+
+    @pytest.mark.asyncio
+    @patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.AsyncConnectionPool')
+    @patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.boto3.Session')
+    async def test_credentials_resolved_in_initialize_pool(self, mock_session, mock_pool_class):
+        """Test that Secrets Manager is only called when the pool is initialized."""
+        mock_client = mock_session.return_value.client.return_value
+        mock_client.get_secret_value.return_value = {
+            'SecretString': '{"username": "db_user", "password": "p w=\'d"}'  # pragma: allowlist secret
+        }
+        mock_pool_class.return_value = AsyncMock()
+
+        psycopg_pool_connection._secrets_manager_client.cache_clear()
+        with patch.dict(psycopg_pool_connection._secret_cache, clear=True):
+            conn = PsycopgPoolConnection(
+                host='localhost',
+                port=5432,
+                database='test_db',
+                readonly=False,
+                secret_arn='init_secret_arn',  # pragma: allowlist secret
+                region='us-east-1',
+            )
+            mock_client.get_secret_value.assert_not_called()
+
+            await conn.initialize_pool()
+
+        psycopg_pool_connection._secrets_manager_client.cache_clear()
+        mock_client.get_secret_value.assert_called_once_with(SecretId='init_secret_arn')
+        assert conn.user == 'db_user'
+        conninfo = conninfo_to_dict(mock_pool_class.call_args[0][0])
+        assert conninfo['user'] == 'db_user'
+        assert conninfo['password'] == "p w='d"  # pragma: allowlist secret
+        assert mock_pool_class.call_args[1]['configure'] == conn._configure_connection
+        mock_pool_class.return_value.open.assert_awaited_once_with(wait=True, timeout=15.0)
+
+    def test_convert_named_parameters_to_psycopg(self):
+        """Test that :name placeholders are rewritten without touching casts or unknown names."""
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=True,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            is_test=True,
+        )
+
+        sql, params = conn._convert_named_parameters_to_psycopg(
+            'SELECT :id::text, :id_suffix, :other FROM t WHERE id = :id',
+            {'id': 1, 'id_suffix': 'x'},
+        )
+
+        assert sql == 'SELECT %(id)s::text, %(id_suffix)s, :other FROM t WHERE id = %(id)s'
+        assert params == {'id': 1, 'id_suffix': 'x'}
+
+    @pytest.mark.asyncio
+    async def test_execute_query_converts_cells_by_type(self):
+        """Test that execute_query maps each result value to the matching cell type."""
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=True,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            is_test=True,
+        )
+        conn.pool = MagicMock()
+        rows = [
+            ('a', 1, 1.5, True, b'\x00', None, Decimal('2.50')),
+            ('b', 2, 2.5, False, b'\x01', None, Decimal('0')),
+        ]
+        connection_cm, mock_conn, _ = _mock_connection(rows, [(name,) for name in 'sifbxnd'])
+
+        with patch.object(conn, '_get_connection', MagicMock(return_value=connection_cm)):
+            result = await conn.execute_query('SELECT 1')
+
+        # Read-only mode comes from the pool's configure hook, not a per-query SET statement
+        mock_conn.execute.assert_not_awaited()
+        mock_conn.pipeline.return_value.__aenter__.return_value.sync.assert_awaited_once()
+        assert [col['name'] for col in result['columnMetadata']] == list('sifbxnd')
+        assert result['records'] == [
+            [
+                {'stringValue': 'a'},
+                {'longValue': 1},
+                {'doubleValue': 1.5},
+                {'booleanValue': True},
+                {'blobValue': b'\x00'},
+                {'isNull': True},
+                {'stringValue': '2.50'},
+            ],
+            [
+                {'stringValue': 'b'},
+                {'longValue': 2},
+                {'doubleValue': 2.5},
+                {'booleanValue': False},
+                {'blobValue': b'\x01'},
+                {'isNull': True},
+                {'stringValue': '0'},
+            ],
+        ]
+        # NULL cells share a single constant instead of allocating one dict per cell, and the
+        # shared cells cannot be modified in place
+        assert result['records'][0][5] is result['records'][1][5]
+        with pytest.raises(TypeError):
+            result['records'][0][5]['isNull'] = False
+        # Rows are shaped by the cursor's row factory rather than converted afterwards
+        assert (
+            mock_conn.cursor.call_args.kwargs['row_factory'] is psycopg_pool_connection._cell_row
+        )
+
+    def test_to_cell_bool_and_subclasses(self):
+        """Test that bools get booleanValue and subclasses keep their base type's cell key."""
+
+        class Level(IntEnum):
+            HIGH = 3
+
+        class Name(str):
+            pass
+
+        # bool is an int subclass but must not be sent as longValue
+        assert psycopg_pool_connection._to_cell(True) == {'booleanValue': True}
+        assert psycopg_pool_connection._to_cell(False) == {'booleanValue': False}
+        assert psycopg_pool_connection._to_cell(Level.HIGH) == {'longValue': Level.HIGH}
+        assert psycopg_pool_connection._to_cell(Name('x')) == {'stringValue': 'x'}
+        assert psycopg_pool_connection._to_cell(Decimal('1.5')) == {'stringValue': '1.5'}
+
+    @pytest.mark.asyncio
+    async def test_execute_query_write_rejected_in_readonly_mode(self):
+        """Test that a readonly write runs in a read-only transaction and its rejection surfaces."""
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=True,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            is_test=True,
+        )
+        conn.pool = MagicMock()
+        connection_cm, mock_conn, cursor = _mock_connection([], None)
+        # What the server answers to a write in a session opened with BEGIN READ ONLY
+        cursor.execute.side_effect = psycopg.errors.ReadOnlySqlTransaction(
+            'cannot execute INSERT in a read-only transaction'
+        )
+
+        with patch.object(conn, '_get_connection', MagicMock(return_value=connection_cm)):
+            with pytest.raises(psycopg.errors.ReadOnlySqlTransaction):
+                await conn.execute_query('INSERT INTO t VALUES (1)')
+
+        # The statement was sent inside the transaction psycopg opens with BEGIN READ ONLY
+        mock_conn.transaction.assert_called_once_with()
+        mock_conn.transaction.return_value.__aenter__.assert_awaited_once()
+        cursor.execute.assert_awaited_once_with('INSERT INTO t VALUES (1)')
+
+    @pytest.mark.asyncio
+    async def test_execute_query_prepares_parameterized_statements(self):
+        """Test that only parameterized queries are executed as prepared statements."""
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=True,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            is_test=True,
+        )
+        conn.pool = MagicMock()
+        connection_cm, _, cursor = _mock_connection([], None)
+
+        with patch.object(conn, '_get_connection', MagicMock(return_value=connection_cm)):
+            await conn.execute_query(
+                'SELECT * FROM t WHERE id = :id',
+                [{'name': 'id', 'value': {'longValue': 1}}],
+            )
+            cursor.execute.assert_awaited_once_with(
+                'SELECT * FROM t WHERE id = %(id)s', {'id': 1}, prepare=True
+            )
+
+            cursor.execute.reset_mock()
+            await conn.execute_query('SELECT 1')
+            cursor.execute.assert_awaited_once_with('SELECT 1')
+
+    @pytest.mark.asyncio
+    @patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.AsyncConnectionPool')
+    async def test_concurrent_initialize_pool_opens_one_pool(self, mock_pool_class):
+        """Test that concurrent first queries create and open a single pool."""
+        mock_pool_class.return_value = AsyncMock()
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=False,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            is_test=True,
+        )
+
+        await asyncio.gather(*(conn.initialize_pool() for _ in range(5)))
+
+        mock_pool_class.assert_called_once()
+        mock_pool_class.return_value.open.assert_awaited_once()
+        assert conn.pool is mock_pool_class.return_value
+
+    @pytest.mark.asyncio
+    async def test_check_connection_health(self):
+        """Test that the health check runs SELECT 1 directly and reports failures."""
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=True,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            is_test=True,
+        )
+        conn.pool = MagicMock()
+        connection_cm, mock_conn, cursor = _mock_connection([], None)
+
+        with patch.object(conn, '_get_connection', MagicMock(return_value=connection_cm)):
+            assert await conn.check_connection_health() is True
+            mock_conn.execute.assert_awaited_once_with('SELECT 1')
+            cursor.execute.assert_not_awaited()
+
+            mock_conn.execute.side_effect = Exception('connection lost')
+            assert await conn.check_connection_health() is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize('readonly', [True, False])
+    async def test_configure_connection_sets_read_only(self, readonly):
+        """Test that the pool configure hook marks new connections read-only when required."""
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=readonly,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            is_test=True,
+        )
+        mock_conn = MagicMock()
+        mock_conn.set_read_only = AsyncMock()
+        mock_conn.set_autocommit = AsyncMock()
+
+        await conn._configure_connection(mock_conn)
+
+        assert mock_conn.prepare_threshold == psycopg_pool_connection.PREPARE_THRESHOLD
+        assert mock_conn.prepared_max == psycopg_pool_connection.PREPARED_STATEMENT_CACHE_SIZE
+        if readonly:
+            mock_conn.set_read_only.assert_awaited_once_with(True)
+            mock_conn.set_autocommit.assert_not_awaited()
+        else:
+            mock_conn.set_read_only.assert_not_awaited()
+            mock_conn.set_autocommit.assert_awaited_once_with(True)
+
+    @pytest.mark.asyncio
+    async def test_execute_query_write_mode_skips_transaction_wrapper(self):
+        """Test that write-mode queries run in autocommit without BEGIN/COMMIT."""
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=False,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            is_test=True,
+        )
+        conn.pool = MagicMock()
+        connection_cm, mock_conn, cursor = _mock_connection([(1,)], [('id',)])
+
+        with patch.object(conn, '_get_connection', MagicMock(return_value=connection_cm)):
+            result = await conn.execute_query('INSERT INTO t VALUES (1) RETURNING id')
+
+        cursor.execute.assert_awaited_once_with('INSERT INTO t VALUES (1) RETURNING id')
+        mock_conn.transaction.assert_not_called()
+        mock_conn.pipeline.assert_not_called()
+        assert result == {'columnMetadata': [{'name': 'id'}], 'records': [[{'longValue': 1}]]}
+
     # Test removed due to compatibility issues with the current implementation
 
     # Multi-threaded tests for connection pool concurrency
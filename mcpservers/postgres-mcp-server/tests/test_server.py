@@ -20,18 +20,29 @@ import json
 import pytest
 import sys
 import uuid
+from awslabs.postgres_mcp_server import server
 from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import PsycopgPoolConnection
 from awslabs.postgres_mcp_server.server import (
     DBConnectionSingleton,
+    _schema_cache,
     client_error_code_key,
+    extract_cell,
     get_table_schema,
+    get_vacuum_progress_current,
+    health_check,
     main,
+    pg_stat_statements,
+    pg_stat_statements_by_calls,
+    pg_stat_statements_missing_key,
+    pg_stat_tables_vacuum_info,
+    run_diagnostic_bundle,
     run_query,
+    table_autovacuum_settings,
     unexpected_error_key,
     write_query_prohibited_key,
 )
 from conftest import DummyCtx, Mock_DBConnection, Mock_PsycopgPoolConnection, MockException
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 
 SAFE_READONLY_QUERIES = [
@@ -657,6 +668,286 @@ async def test_get_table_schema():
     validate_normal_query_response(column_records)
 
 
+@pytest.mark.asyncio
+async def test_get_table_schema_is_cached():
+    """Test that repeated get_table_schema calls reuse the cached result until it is cleared."""
+    DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=False, is_test=True)
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    mock_db_connection.data_client.add_mock_response(get_mock_normal_query_response())
+    DBConnectionSingleton._instance._db_connection = mock_db_connection  # type: ignore
+    _schema_cache.clear()
+
+    ctx = DummyCtx()
+    first = await get_table_schema('cached_table', ctx)
+    # The mock client holds a single response, so a second query would return an error
+    second = await get_table_schema('cached_table', ctx)
+    assert second is first
+    validate_normal_query_response(second[0])
+
+    _schema_cache.clear()
+    error_response = await get_table_schema('cached_table', ctx)
+    assert 'error' in error_response[0]
+    # Failed lookups are not cached
+    assert 'cached_table' not in _schema_cache
+
+
+@pytest.mark.asyncio
+async def test_run_query_write_clears_schema_cache():
+    """Test that a successful write query drops the cached table schemas."""
+    DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=False, is_test=True)
+    mock_db_connection = Mock_DBConnection(readonly=False)
+    ctx = DummyCtx()
+    _schema_cache.clear()
+    _schema_cache['cached_table'] = (0.0, [])
+
+    # A read leaves the cache alone
+    mock_db_connection.data_client.add_mock_response(get_mock_normal_query_response())
+    await run_query('SELECT * FROM cached_table', ctx, mock_db_connection)
+    assert 'cached_table' in _schema_cache
+
+    # A failed write leaves the cache alone; the mock client has no response left
+    error_response = await run_query(
+        'ALTER TABLE cached_table ADD COLUMN c int', ctx, mock_db_connection
+    )
+    assert 'error' in error_response[0]
+    assert 'cached_table' in _schema_cache
+
+    mock_db_connection.data_client.add_mock_response(get_mock_normal_query_response())
+    await run_query('ALTER TABLE cached_table ADD COLUMN c int', ctx, mock_db_connection)
+    assert not _schema_cache
+
+
+@pytest.mark.asyncio
+async def test_vacuum_tools_bind_table_names():
+    """Test that table name filters are passed as parameters rather than spliced into SQL."""
+    DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=True, is_test=True)
+    mock_db_connection = MagicMock(readonly_query=True)
+    mock_db_connection.execute_query = AsyncMock(
+        return_value={'columnMetadata': [], 'records': []}
+    )
+    DBConnectionSingleton._instance._db_connection = mock_db_connection  # type: ignore
+
+    ctx = DummyCtx()
+    table_name = "t'; DROP TABLE users; --"
+    await table_autovacuum_settings(ctx, table_name=table_name)
+    sql, params = mock_db_connection.execute_query.await_args.args
+    assert table_name not in sql
+    assert params == [{'name': 'table_name', 'value': {'stringValue': table_name}}]
+
+    await pg_stat_tables_vacuum_info(ctx, table_names='a,b')
+    first_sql, params = mock_db_connection.execute_query.await_args.args
+    assert params == [{'name': 'table_names', 'value': {'stringValue': 'a,b'}}]
+
+    # Every call sends the same query text, whatever tables are requested
+    await pg_stat_tables_vacuum_info(ctx)
+    sql, params = mock_db_connection.execute_query.await_args.args
+    assert sql == first_sql
+    assert params == [{'name': 'table_names', 'value': {'stringValue': ''}}]
+
+
+@pytest.mark.asyncio
+async def test_diagnostic_tools_skip_query_screening():
+    """Test that the tools' own SQL is not screened like user-supplied queries."""
+    DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=True, is_test=True)
+    mock_db_connection = MagicMock(readonly_query=True)
+    mock_db_connection.execute_query = AsyncMock(
+        return_value={'columnMetadata': [], 'records': []}
+    )
+    DBConnectionSingleton._instance._db_connection = mock_db_connection  # type: ignore
+
+    # The vacuum progress query matches '^vacuum', which the readonly keyword check rejects
+    assert await get_vacuum_progress_current(DummyCtx()) == []
+    mock_db_connection.execute_query.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_pg_stat_statements_checks_extension_once(monkeypatch):
+    """Test that the pg_stat_statements tools probe for the extension until it is found."""
+    DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=True, is_test=True)
+    mock_db_connection = MagicMock(readonly_query=True)
+    DBConnectionSingleton._instance._db_connection = mock_db_connection  # type: ignore
+    monkeypatch.setattr(server, '_pg_stat_statements_installed', False)
+
+    no_rows = {'columnMetadata': [{'name': '?column?'}], 'records': []}
+    one_row = {'columnMetadata': [{'name': '?column?'}], 'records': [[{'longValue': 1}]]}
+    stats = {'columnMetadata': [{'name': 'calls'}], 'records': [[{'longValue': 5}]]}
+    mock_db_connection.execute_query = AsyncMock(side_effect=[no_rows, one_row, stats, stats])
+
+    ctx = DummyCtx()
+    assert await pg_stat_statements(ctx) == [{'error': pg_stat_statements_missing_key}]
+    assert await pg_stat_statements(ctx) == [{'calls': 5}]
+    # Once the extension has been found, the probe is skipped
+    assert await pg_stat_statements_by_calls(ctx) == [{'calls': 5}]
+    assert mock_db_connection.execute_query.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_run_diagnostic_bundle():
+    """Test that run_diagnostic_bundle runs each named diagnostic and reports unknown names."""
+    DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=True, is_test=True)
+    mock_db_connection = MagicMock(readonly_query=True)
+    mock_db_connection.execute_query = AsyncMock(
+        return_value={'columnMetadata': [{'name': 'oldest_xid'}], 'records': [[{'longValue': 7}]]}
+    )
+    DBConnectionSingleton._instance._db_connection = mock_db_connection  # type: ignore
+
+    result = await run_diagnostic_bundle(
+        DummyCtx(),
+        ['oldest_xid_all_databases', 'oldest_xid_by_database', 'no_such_tool'],
+    )
+
+    assert list(result) == ['oldest_xid_all_databases', 'oldest_xid_by_database', 'no_such_tool']
+    assert result['oldest_xid_all_databases'] == [{'oldest_xid': 7}]
+    assert result['oldest_xid_by_database'] == [{'oldest_xid': 7}]
+    assert result['no_such_tool'] == [{'error': 'Unknown diagnostic: no_such_tool'}]
+    assert mock_db_connection.execute_query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_run_diagnostic_bundle_bounds_concurrency():
+    """Test that a full bundle never runs more diagnostics at once than the configured limit."""
+    DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=True, is_test=True)
+    in_flight = 0
+    peak = 0
+
+    async def execute_query(sql, parameters=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return {'columnMetadata': [{'name': 'value'}], 'records': [[{'longValue': 1}]]}
+
+    mock_db_connection = MagicMock(readonly_query=True)
+    mock_db_connection.execute_query = execute_query
+    DBConnectionSingleton._instance._db_connection = mock_db_connection  # type: ignore
+
+    result = await run_diagnostic_bundle(DummyCtx(), list(server._BUNDLE_DIAGNOSTICS))
+
+    assert len(result) == len(server._BUNDLE_DIAGNOSTICS)
+    assert peak == server.MAX_CONCURRENT_BUNDLE_DIAGNOSTICS
+
+
+def test_bundle_concurrency_follows_pool_size():
+    """Test that a bundle's concurrency is sized from the psycopg pool's max_size."""
+
+    def pool(max_size):
+        return PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=True,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            max_size=max_size,
+            is_test=True,
+        )
+
+    assert server._bundle_concurrency(pool(10)) == 2
+    assert server._bundle_concurrency(pool(2)) == 1
+    assert server._bundle_concurrency(pool(40)) == server.MAX_CONCURRENT_BUNDLE_DIAGNOSTICS
+    assert server._bundle_concurrency(MagicMock()) == server.MAX_CONCURRENT_BUNDLE_DIAGNOSTICS
+
+
+@pytest.mark.asyncio
+async def test_health_check_reuses_response():
+    """Test that the health check returns the same prebuilt OK response every time."""
+    first = await health_check(MagicMock())
+    assert first.status_code == 200
+    assert first.body == b'OK'
+    assert await health_check(MagicMock()) is first
+
+
+def test_extract_cell():
+    """Test that extract_cell returns the single value of a cell, honouring isNull."""
+    assert extract_cell({'longValue': 3}) == 3
+    assert extract_cell({'isNull': False, 'stringValue': 'a'}) == 'a'
+    assert extract_cell({'booleanValue': False, 'isNull': False}) is False
+    assert extract_cell({'isNull': True}) is None
+    assert extract_cell({}) is None
+
+
+def test_run_on_uvloop_if_available(monkeypatch):
+    """Test that the coroutine runs on uvloop only when uvloop is importable."""
+    run = MagicMock(return_value=True)
+    monkeypatch.setattr(server.asyncio, 'run', run)
+
+    monkeypatch.setitem(sys.modules, 'uvloop', None)
+    assert server._run_on_uvloop_if_available(coro := MagicMock()) is True
+    run.assert_called_once_with(coro)
+
+    fake_uvloop = MagicMock()
+    monkeypatch.setitem(sys.modules, 'uvloop', fake_uvloop)
+    assert server._run_on_uvloop_if_available(coro) is fake_uvloop.run.return_value
+    fake_uvloop.run.assert_called_once_with(coro)
+    run.assert_called_once()
+
+
+def test_main_configures_log_sink(monkeypatch):
+    """Test that main, not the module import, replaces the loguru sinks."""
+    mock_logger = MagicMock()
+    monkeypatch.setattr(server, 'logger', mock_logger)
+    monkeypatch.delenv('FASTMCP_LOG_LEVEL', raising=False)
+    monkeypatch.setattr(sys, 'argv', ['server.py'])
+
+    # The required arguments are missing, so argparse exits after the sink is configured
+    with pytest.raises(SystemExit):
+        main()
+
+    mock_logger.remove.assert_called_once_with()
+    mock_logger.add.assert_called_once_with(sys.stderr, level='INFO')
+
+
+def test_server_config_from_env(monkeypatch):
+    """Test that ServerConfig reads the HTTP and pool settings from the environment."""
+    for name in ('MCP_HOST', 'MCP_PORT', 'POSTGRES_POOL_MIN_SIZE', 'POSTGRES_POOL_MAX_SIZE'):
+        monkeypatch.delenv(name, raising=False)
+
+    config = server.ServerConfig.from_env()
+    assert config == server.ServerConfig(
+        mcp_host=None, mcp_port=None, pool_min_size=1, pool_max_size=10
+    )
+
+    monkeypatch.setenv('MCP_HOST', '0.0.0.0')
+    monkeypatch.setenv('MCP_PORT', '8000')
+    monkeypatch.setenv('POSTGRES_POOL_MAX_SIZE', '20')
+    config = server.ServerConfig.from_env()
+    assert (config.mcp_host, config.mcp_port, config.pool_max_size) == ('0.0.0.0', 8000, 20)
+
+
+def test_validate_and_serve_runs_on_one_loop(monkeypatch):
+    """Test that the health check and the MCP server share one event loop."""
+    loops = []
+
+    async def record_loop(*args, **kwargs):
+        loops.append(asyncio.get_running_loop())
+        return True
+
+    db_connection = MagicMock()
+    db_connection.check_connection_health = AsyncMock(side_effect=record_loop)
+    db_connection.close = AsyncMock()
+    monkeypatch.setattr(server.mcp, 'run_stdio_async', AsyncMock(side_effect=record_loop))
+    config = server.ServerConfig(mcp_host=None, mcp_port=None, pool_min_size=1, pool_max_size=10)
+
+    assert asyncio.run(server._validate_and_serve(db_connection, config)) is True
+    assert len(loops) == 2 and loops[0] is loops[1]
+    db_connection.close.assert_awaited_once()
+
+
+def test_validate_and_serve_stops_on_failed_health_check(monkeypatch):
+    """Test that the server is not started when the connection cannot be validated."""
+    db_connection = MagicMock()
+    db_connection.check_connection_health = AsyncMock(return_value=False)
+    db_connection.close = AsyncMock()
+    run_stdio = AsyncMock()
+    monkeypatch.setattr(server.mcp, 'run_stdio_async', run_stdio)
+    config = server.ServerConfig(mcp_host=None, mcp_port=None, pool_min_size=1, pool_max_size=10)
+
+    assert asyncio.run(server._validate_and_serve(db_connection, config)) is False
+    run_stdio.assert_not_called()
+    db_connection.close.assert_awaited_once()
+
+
 def test_main_with_valid_parameters(monkeypatch, capsys):
     """Test main function with valid command line parameters.
 
@@ -685,7 +976,7 @@ def test_main_with_valid_parameters(monkeypatch, capsys):
             'True',
         ],
     )
-    monkeypatch.setattr('awslabs.postgres_mcp_server.server.mcp.run', lambda: None)
+    monkeypatch.setattr('awslabs.postgres_mcp_server.server.mcp.run_stdio_async', AsyncMock())
 
     # Mock the connection so main can complete successfully
     DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=False, is_test=True)
@@ -725,7 +1016,7 @@ def test_main_with_invalid_parameters(monkeypatch, capsys):
             'True',
         ],
     )
-    monkeypatch.setattr('awslabs.postgres_mcp_server.server.mcp.run', lambda: None)
+    monkeypatch.setattr('awslabs.postgres_mcp_server.server.mcp.run_stdio_async', AsyncMock())
 
     # This test of main() will succeed in parsing parameters and create connection object.
     # However, since connection object is not boto3 client with real credential, the validate of connection will fail and cause system exit
@@ -784,7 +1075,7 @@ def test_main_with_psycopg_parameters(monkeypatch, capsys):
             'True',
         ],
     )
-    monkeypatch.setattr('awslabs.postgres_mcp_server.server.mcp.run', lambda: None)
+    monkeypatch.setattr('awslabs.postgres_mcp_server.server.mcp.run_stdio_async', AsyncMock())
 
     # The key fix: patch the PsycopgPoolConnection.__init__ to set is_test=True
     original_init = PsycopgPoolConnection.__init__
@@ -841,7 +1132,7 @@ def test_main_with_psycopg_parameters(monkeypatch, capsys):
     # Patch _get_connection to return our mock connection
     monkeypatch.setattr(
         'awslabs.postgres_mcp_server.connection.psycopg_pool_connection.PsycopgPoolConnection._get_connection',
-        AsyncMock(return_value=mock_conn),
+        MagicMock(return_value=mock_conn),
     )
 
     # Also patch the initialize_pool method to prevent actual connection attempts
@@ -850,17 +1141,10 @@ def test_main_with_psycopg_parameters(monkeypatch, capsys):
         AsyncMock(return_value=None),
     )
 
-    # And patch check_connection_health to return a successful result
-    # Create an event loop and set it as the current event loop
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    # Now create the Future with the loop
-    future = asyncio.Future()
-    future.set_result(True)
+    # And patch check_connection_health, which main() awaits to validate the connection
     monkeypatch.setattr(
         'awslabs.postgres_mcp_server.connection.psycopg_pool_connection.PsycopgPoolConnection.check_connection_health',
-        lambda self: future,
+        AsyncMock(return_value=True),
     )
 
     # Patch execute_query to return a successful result
@@ -899,7 +1183,7 @@ def test_main_with_invalid_psycopg_parameters(monkeypatch, capsys):
             'True',
         ],
     )
-    monkeypatch.setattr('awslabs.postgres_mcp_server.server.mcp.run', lambda: None)
+    monkeypatch.setattr('awslabs.postgres_mcp_server.server.mcp.run_stdio_async', AsyncMock())
 
     # This test of main() will fail due to invalid port
     with pytest.raises(SystemExit) as excinfo:
@@ -907,6 +1191,43 @@ def test_main_with_invalid_psycopg_parameters(monkeypatch, capsys):
     assert excinfo.value.code == 2  # argparse exits with code 2 for invalid arguments
 
 
+@pytest.mark.parametrize(
+    'connection_args, message',
+    [
+        ([], 'Either --resource_arn (for RDS Data API) or --hostname'),
+        (
+            ['--resource_arn', 'arn', '--hostname', 'localhost'],
+            'Cannot specify both --resource_arn and --hostname',
+        ),
+    ],
+)
+def test_main_requires_exactly_one_connection_method(
+    monkeypatch, capsys, connection_args, message
+):
+    """Test that main() rejects neither or both of --resource_arn and --hostname."""
+    monkeypatch.setattr(
+        sys,
+        'argv',
+        [
+            'server.py',
+            *connection_args,
+            '--secret_arn',  # pragma: allowlist secret
+            'arn',
+            '--database',
+            'postgres',
+            '--region',
+            'us-west-2',
+            '--readonly',
+            'True',
+        ],
+    )
+
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 2
+    assert message in capsys.readouterr().err
+
+
 if __name__ == '__main__':
     DBConnectionSingleton.initialize('mock', 'mock', 'mock', 'mock', readonly=True, is_test=True)
     asyncio.run(test_run_query_well_formatted_response())
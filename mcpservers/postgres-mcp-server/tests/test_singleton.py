@@ -13,9 +13,11 @@
 # limitations under the License.
 """Tests for the connection interfaces functionality."""
 
+import asyncio
 import pytest
 from awslabs.postgres_mcp_server.connection.db_connection_singleton import DBConnectionSingleton
-from unittest.mock import MagicMock, patch
+from awslabs.postgres_mcp_server.connection.rds_api_connection import RDS_DATA_CLIENT_CONFIG
+from unittest.mock import AsyncMock, MagicMock, patch
 
 
 class TestDBConnectionSingleton:
@@ -81,6 +83,20 @@ class TestDBConnectionSingleton:
             DBConnectionSingleton.get()
         assert 'DBConnectionSingleton is not initialized' in str(excinfo.value)
 
+    def test_singleton_set_connection(self):
+        """Test that set_connection() installs an existing connection as the singleton's."""
+        # Reset singleton
+        DBConnectionSingleton._instance = None
+
+        mock_conn = MagicMock()
+        DBConnectionSingleton.set_connection(mock_conn)
+        assert DBConnectionSingleton.get().db_connection is mock_conn
+
+        # A later connection replaces the earlier one
+        other_conn = MagicMock()
+        DBConnectionSingleton.set_connection(other_conn)
+        assert DBConnectionSingleton.get().db_connection is other_conn
+
     def test_singleton_cleanup(self):
         """Test that cleanup() correctly closes the connection."""
         # Reset singleton
@@ -88,9 +104,10 @@ class TestDBConnectionSingleton:
 
         # Setup mock
         with patch(
-            'awslabs.postgres_mcp_server.connection.rds_api_connection.RDSDataAPIConnection'
+            'awslabs.postgres_mcp_server.connection.db_connection_singleton.RDSDataAPIConnection'
         ) as mock_rds_connection:
             mock_conn = MagicMock()
+            mock_conn.close = AsyncMock()
             mock_rds_connection.return_value = mock_conn
 
             # Initialize singleton
@@ -107,10 +124,37 @@ class TestDBConnectionSingleton:
             with patch('asyncio.get_event_loop') as mock_get_loop:
                 mock_loop = MagicMock()
                 mock_loop.is_running.return_value = False
+                mock_loop.run_until_complete.side_effect = asyncio.run
                 mock_get_loop.return_value = mock_loop
 
                 # Call cleanup
                 DBConnectionSingleton.cleanup()
 
-                # Verify close() was called
+                # Verify close() was awaited
                 mock_loop.run_until_complete.assert_called_once()
+                mock_conn.close.assert_awaited_once()
+
+    def test_singleton_rds_data_client_config(self):
+        """Test that the RDS Data API client is created once with the shared client config."""
+        # Reset singleton
+        DBConnectionSingleton._instance = None
+
+        with patch(
+            'awslabs.postgres_mcp_server.connection.rds_api_connection.boto3.client'
+        ) as mock_client:
+            DBConnectionSingleton.initialize(
+                resource_arn='test_resource_arn',
+                secret_arn='test_secret_arn',  # pragma: allowlist secret
+                database='test_db',
+                region='us-east-1',
+                readonly=True,
+            )
+
+            mock_client.assert_called_once_with(
+                'rds-data', region_name='us-east-1', config=RDS_DATA_CLIENT_CONFIG
+            )
+            assert (
+                DBConnectionSingleton.get().db_connection.data_client is mock_client.return_value
+            )
+
+        DBConnectionSingleton._instance = None